@@ -6,11 +6,16 @@ import numpy as np
 import sounddevice as sd
 import aubio
 import threading
-import queue
 import time
 from collections import deque
 import config
 
+# Keys of the get_state() dict, in get_snapshot() values order
+STATE_KEYS = (
+    'bpm', 'intensity', 'audio_active', 'bass', 'mid', 'high',
+    'is_building', 'is_drop', 'genre'
+)
+
 
 class AudioAnalyzer:
     def __init__(self, state_lock, beat_queue, stop_event):
@@ -19,7 +24,7 @@ class AudioAnalyzer:
         
         Args:
             state_lock: Threading lock for shared state access
-            beat_queue: Queue for beat events to lighting module
+            beat_queue: Deque for beat events to lighting module
             stop_event: Threading event to signal shutdown
         """
         self.state_lock = state_lock
@@ -48,6 +53,17 @@ class AudioAnalyzer:
         }
         self.detected_genre = 'auto'
         
+        # Immutable (version, values, state dict) snapshot, swapped in whole so
+        # readers load it without the lock. values is in STATE_KEYS order, the
+        # dict returned by get_state() is built from it once per change, and
+        # the version increments with every change.
+        values = (0.0, 0.0, False, 0.0, 0.0, 0.0, False, False, 'auto')
+        self._snapshot = (0, values, dict(zip(STATE_KEYS, values)))
+        
+        # Callbacks run (on the audio thread) after each snapshot change;
+        # replaced copy-on-write so the audio thread can iterate without a lock
+        self._state_listeners = ()
+        
         # Audio analysis setup
         self.tempo_detector = aubio.tempo(
             "default",
@@ -88,7 +104,7 @@ class AudioAnalyzer:
             )
             
             self.stream.start()
-            start_time = time.time()
+            start_time = time.monotonic()
             
             while not self.stop_event.is_set():
                 try:
@@ -102,7 +118,7 @@ class AudioAnalyzer:
                     buffer = np.array(audio_data, dtype=np.float32).flatten()
                     
                     # Process with aubio for beat detection
-                    current_time = time.time() - start_time
+                    current_time = time.monotonic() - start_time
                     beat_detected = self.tempo_detector(buffer)
                     
                     if beat_detected:
@@ -165,11 +181,7 @@ class AudioAnalyzer:
                 self.current_bpm = bpm
         
         # Send beat event to lighting module
-        self.beat_queue.put({
-            'timestamp': current_time,
-            'bpm': self.current_bpm,
-            'intensity': self.current_intensity
-        })
+        self.beat_queue.append(current_time)
     
     def _update_intensity(self, rms):
         """Update and smooth the intensity measurement."""
@@ -201,11 +213,34 @@ class AudioAnalyzer:
         # Update audio active status
         self.audio_active = self.silent_frames < config.SILENCE_FRAME_COUNT
     
+    def add_state_listener(self, callback):
+        """Register a no-argument callback run whenever the state snapshot changes."""
+        self._state_listeners = self._state_listeners + (callback,)
+    
+    def remove_state_listener(self, callback):
+        """Unregister a callback added with add_state_listener."""
+        self._state_listeners = tuple(cb for cb in self._state_listeners if cb != callback)
+    
     def _update_shared_state(self):
         """Update the shared state variables with thread lock."""
+        changed = False
         with self.state_lock:
-            # These will be read by other threads
-            pass  # State is already updated in instance variables
+            # Most values are read directly from instance variables; only
+            # republish the GUI snapshot when something actually changed
+            values = (
+                self.current_bpm, self.current_intensity, self.audio_active,
+                self.bass_intensity, self.mid_intensity, self.high_intensity,
+                self.is_building, self.is_drop, self.detected_genre
+            )
+            version, published, _ = self._snapshot
+            if values != published:
+                self._snapshot = (version + 1, values, dict(zip(STATE_KEYS, values)))
+                changed = True
+                
+        # Notify outside the lock so listeners may call get_state()
+        if changed:
+            for callback in self._state_listeners:
+                callback()
     
     def _analyze_frequencies(self, samples):
         """Analyze frequency content of audio samples."""
@@ -249,7 +284,7 @@ class AudioAnalyzer:
         # Detect build-up (gradual increase)
         if recent_avg > older_avg * 1.2 and not self.is_building:
             self.is_building = True
-            self.build_start_time = time.time()
+            self.build_start_time = time.monotonic()
             
         # Detect drop (sudden increase after build)
         if self.is_building and intensity > recent_avg * 1.5:
@@ -258,7 +293,7 @@ class AudioAnalyzer:
             # Drop will auto-clear after 1 second
             
         # Clear drop flag after 1 second
-        if self.is_drop and time.time() - self.build_start_time > 1.0:
+        if self.is_drop and time.monotonic() - self.build_start_time > 1.0:
             self.is_drop = False
     
     def _detect_genre(self, bpm, bass_intensity, has_beat):
@@ -296,19 +331,24 @@ class AudioAnalyzer:
                     break
     
     def get_state(self):
-        """Get current audio state (thread-safe)."""
-        with self.state_lock:
-            return {
-                'bpm': self.current_bpm,
-                'intensity': self.current_intensity,
-                'audio_active': self.audio_active,
-                'bass': self.bass_intensity,
-                'mid': self.mid_intensity,
-                'high': self.high_intensity,
-                'is_building': self.is_building,
-                'is_drop': self.is_drop,
-                'genre': self.detected_genre
-            }
+        """
+        Get current audio state (thread-safe, no lock needed).
+        
+        Returns the latest published snapshot dict. It is replaced rather than
+        modified on each change, so callers must treat it as read-only.
+        """
+        return self._snapshot[2]
+    
+    def get_snapshot(self):
+        """
+        Get the latest versioned audio state (thread-safe, no lock needed).
+        
+        Returns:
+            (version, values) where values is a tuple in STATE_KEYS order and
+            version changes whenever any of the values do
+        """
+        version, values, _ = self._snapshot
+        return version, values
     
     def stop(self):
         """Stop the audio analysis thread."""
@@ -22,6 +22,9 @@ DMX_CHANNELS = 56                  # Total channels to send (8 PARs * 7 channels
 UPDATE_FPS = 30                    # DMX update frequency
 DEFAULT_LIGHT_COUNT = 4            # Default number of active lights
 MAX_LIGHTS = 8                     # Maximum supported lights
+DMX_CPU = 3                        # CPU core to pin the DMX thread to (None to leave unpinned)
+DMX_RT_PRIORITY = 10               # SCHED_FIFO priority for the DMX thread (None for normal scheduling;
+                                   # needs CAP_SYS_NICE, e.g. AmbientCapabilities=CAP_SYS_NICE under systemd)
 
 # PAR light configuration - Up to 8 PAR lights with RGBW or similar channels
 # Adjust channel mappings based on your specific PAR light models
@@ -285,4 +288,12 @@ COLOR_THEMES = {
 GUI_UPDATE_INTERVAL = 200          # GUI refresh interval in milliseconds
 WINDOW_WIDTH = 480                 # Width for small touchscreen
 WINDOW_HEIGHT = 320                # Height for small touchscreen (landscape orientation)
-FULLSCREEN = True                  # Set to True for fullscreen kiosk mode (ESC or Q to exit)
\ No newline at end of file
+FULLSCREEN = True                  # Set to True for fullscreen kiosk mode (ESC or Q to exit)
+GIL_SWITCH_INTERVAL = 0.02         # Thread switch interval in seconds while the GUI runs (None keeps Python's 5 ms)
+BPM_SYNC_DIVISIONS = {             # BPM sync dropdown label -> beats per change
+    "Every beat": 1,
+    "Every 2 beats": 2,
+    "Every 4 beats": 4,
+    "Every 8 beats": 8,
+    "Every 16 beats": 16,
+}
\ No newline at end of file
@@ -2,15 +2,25 @@
 Advanced DMX lighting control module for managing PAR lights via OLA.
 """
 
-import array
 import threading
 import time
 import math
 import random
+import numpy as np
 from lighting_base import BaseDmxController
+import lighting_kernel
 import config
 
 
+# Number of uniform samples pregenerated per refill of the color-selection pool
+RNG_POOL_SIZE = 4096
+
+# Wave neighbour lookup: _NEXT_LIGHT[count][i] == (i + 1) % count
+_NEXT_LIGHT = [()] + [
+    tuple((i + 1) % count for i in range(count)) for count in range(1, config.MAX_LIGHTS + 1)
+]
+
+
 class DmxController(BaseDmxController):
     def __init__(self, audio_analyzer, beat_queue, stop_event):
         """
@@ -18,7 +28,7 @@ class DmxController(BaseDmxController):
         
         Args:
             audio_analyzer: Reference to audio analyzer for state access
-            beat_queue: Queue for receiving beat events
+            beat_queue: Deque for receiving beat events
             stop_event: Threading event to signal shutdown
         """
         # Call parent class constructor
@@ -33,9 +43,15 @@ class DmxController(BaseDmxController):
         # Start with diverse colors instead of all black/red
         initial_colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), 
                          (255, 0, 255), (0, 255, 255), (255, 128, 0), (128, 0, 255)]
-        self.target_colors = [initial_colors[i % len(initial_colors)] for i in range(config.MAX_LIGHTS)]
-        self.current_colors = [initial_colors[i % len(initial_colors)] for i in range(config.MAX_LIGHTS)]
-        self.color_fade_progress = [0.0] * config.MAX_LIGHTS  # Fade progress for each PAR
+        # (target, current) color tables from lighting_kernel, so its fade kernel can
+        # update them in place. _do_initialize_colors swaps in a new pair with one
+        # assignment, so the DMX loop reads them without control_lock.
+        start_colors = [initial_colors[i % len(initial_colors)] for i in range(config.MAX_LIGHTS)]
+        self._color_tables = (
+            lighting_kernel.color_table(start_colors),
+            lighting_kernel.color_table(start_colors)
+        )
+        self.color_fade_progress = lighting_kernel.progress_table(config.MAX_LIGHTS)  # Fade progress for each PAR
         self.last_color_change = 0
         self.color_phases = [i * 0.2 for i in range(config.MAX_LIGHTS)]  # Phase offset for smooth waves
         
@@ -76,12 +92,70 @@ class DmxController(BaseDmxController):
         
         self.control_lock = threading.Lock()
         
+        # Immutable snapshot of the hot-path controls, read lock-free by the DMX loop
+        self._publish_params()
+        
+        # Pool of pregenerated uniform samples for palette index draws
+        self._rng = np.random.default_rng()
+        self._rng_buf = self._rng.random(RNG_POOL_SIZE).tolist()
+        self._rng_pos = 0
+        
         # Initialize colors
         self._initialize_colors()
         
+        # Offset table in the representation the frame kernel expects
+        self._channel_layout = lighting_kernel.layout_table(self._channel_layout)
+        
+        # Compile the frame kernels here rather than on the real-time DMX thread
+        lighting_kernel.warm_up()
+        
         # DMX frame update interval (milliseconds)
         self.update_interval = int(1000 / config.UPDATE_FPS)
         
+    def _publish_params(self):
+        """
+        Publish the controls read every frame as a single immutable tuple.
+        
+        Writers rebuild the tuple after changing a control; the DMX loop just
+        loads the reference (an atomic store in CPython) instead of taking
+        control_lock every frame. Must be called with control_lock held, so
+        two writers can't interleave and publish a stale value (the DMX thread
+        goes through _try_update_controls).
+        """
+        self._params = (
+            self.smoothness,
+            self.rainbow_level,
+            self.brightness_control,
+            self.strobe_level,
+            self.pattern,
+            self.bpm_sync,
+        )
+        # Bind the per-light pattern function once per pattern change instead
+        # of walking the pattern branches for every light every frame
+        self._apply_pattern = getattr(self, f"_pattern_{self.pattern}", self._pattern_sync)
+    
+    def _try_update_controls(self, **changes):
+        """
+        Set controls from the DMX thread and republish the snapshot.
+        
+        Uses a non-blocking acquire so a frame never waits on a UI setter.
+        
+        Args:
+            **changes: Control attribute names and their new values
+            
+        Returns:
+            False if control_lock was busy (nothing changed; retry next frame)
+        """
+        if not self.control_lock.acquire(blocking=False):
+            return False
+        try:
+            for name, value in changes.items():
+                setattr(self, name, value)
+            self._publish_params()
+        finally:
+            self.control_lock.release()
+        return True
+    
     def _initialize_colors(self, already_locked=False):
         """Initialize starting colors based on rainbow level."""
         # Only acquire lock if not already held
@@ -101,6 +175,7 @@ class DmxController(BaseDmxController):
         palette_size = len(palette) if palette else 1
         
         # Distribute colors across lights based on rainbow level
+        colors = []
         for i in range(config.MAX_LIGHTS):
             if i < self.active_lights:
                 if self.rainbow_level < 0.2:
@@ -112,13 +187,13 @@ class DmxController(BaseDmxController):
                     step = max(1, int(palette_size * self.rainbow_level / max(1, self.active_lights)))
                     idx = (i * step) % palette_size
                 
-                color = palette[idx] if idx < len(palette) else palette[0]
-                self.target_colors[i] = color
-                self.current_colors[i] = color
+                colors.append(palette[idx] if idx < len(palette) else palette[0])
             else:
                 # Inactive lights stay off
-                self.target_colors[i] = (0, 0, 0)
-                self.current_colors[i] = (0, 0, 0)
+                colors.append((0, 0, 0))
+        
+        # Fresh tables rather than in-place writes, which could race the DMX loop
+        self._color_tables = (lighting_kernel.color_table(colors), lighting_kernel.color_table(colors))
     
     def set_smoothness(self, value):
         """Set the smoothness level (0.0 = fast, 1.0 = very smooth)."""
@@ -126,6 +201,7 @@ class DmxController(BaseDmxController):
         if self.control_lock.acquire(timeout=0.01):  # 10ms timeout
             try:
                 self.smoothness = max(0.0, min(1.0, value))
+                self._publish_params()
             finally:
                 self.control_lock.release()
     
@@ -135,6 +211,7 @@ class DmxController(BaseDmxController):
         if self.control_lock.acquire(timeout=0.01):  # 10ms timeout
             try:
                 self.rainbow_level = max(0.0, min(1.0, value))
+                self._publish_params()
                 # Don't update colors here - let the main loop handle it
             finally:
                 self.control_lock.release()
@@ -148,6 +225,7 @@ class DmxController(BaseDmxController):
         if self.control_lock.acquire(timeout=0.01):  # 10ms timeout
             try:
                 self.brightness_control = max(0.0, min(1.0, value))
+                self._publish_params()
             finally:
                 self.control_lock.release()
     
@@ -157,6 +235,7 @@ class DmxController(BaseDmxController):
         if self.control_lock.acquire(timeout=0.01):  # 10ms timeout
             try:
                 self.strobe_level = max(0.0, min(1.0, value))
+                self._publish_params()
             finally:
                 self.control_lock.release()
     
@@ -262,6 +341,7 @@ class DmxController(BaseDmxController):
         if self.control_lock.acquire(timeout=0.01):
             try:
                 self.bpm_sync = max(0.1, min(2.0, value))
+                self._publish_params()
             finally:
                 self.control_lock.release()
     
@@ -276,6 +356,7 @@ class DmxController(BaseDmxController):
                     if pattern_name == 'swell':
                         # Initialize swell phase
                         self.swell_phase = 0.0
+                    self._publish_params()
                 finally:
                     self.control_lock.release()
     
@@ -320,6 +401,8 @@ class DmxController(BaseDmxController):
                 self.spectrum_mode = False
                 self.active_lights = config.DEFAULT_LIGHT_COUNT
                 
+                self._publish_params()
+                
                 # Clear buffers
                 self.echo_buffer.clear()
                 self.effect_phase = 0.0
@@ -460,7 +543,7 @@ class DmxController(BaseDmxController):
         # Random pattern switching
         if beat_occurred and random.random() < self.chaos_level * 0.05:
             patterns = ["sync", "wave", "center", "alternate", "mirror"]
-            self.pattern = random.choice(patterns)
+            self._try_update_controls(pattern=random.choice(patterns))
             
         return r, g, b
     
@@ -473,34 +556,32 @@ class DmxController(BaseDmxController):
         
         if genre == 'edm':
             # Fast, intense, strobing
-            self.smoothness = 0.2
-            self.beat_sensitivity = 0.8
-            self.strobe_level = 0.3
+            changes = dict(smoothness=0.2, beat_sensitivity=0.8, strobe_level=0.3)
         elif genre == 'hiphop':
             # Strong beats, moderate speed
-            self.smoothness = 0.4
-            self.beat_sensitivity = 0.9
-            self.rainbow_level = 0.3
+            changes = dict(smoothness=0.4, beat_sensitivity=0.9, rainbow_level=0.3)
         elif genre == 'rock':
             # Warm colors, moderate response
-            self.smoothness = 0.5
-            self.beat_sensitivity = 0.6
+            changes = dict(smoothness=0.5, beat_sensitivity=0.6)
             if self.color_theme == 'default':
-                self.color_theme = 'warm'
+                changes['color_theme'] = 'warm'
         elif genre == 'jazz':
             # Smooth, sophisticated
-            self.smoothness = 0.8
-            self.beat_sensitivity = 0.3
-            self.rainbow_level = 0.2
+            changes = dict(smoothness=0.8, beat_sensitivity=0.3, rainbow_level=0.2)
         elif genre == 'ambient':
             # Ultra smooth, minimal beat response
-            self.smoothness = 0.95
-            self.beat_sensitivity = 0.1
-            self.ambient_mode = True
+            changes = dict(smoothness=0.95, beat_sensitivity=0.1, ambient_mode=True)
+        else:
+            changes = {}
+        
+        # Enforced every frame, but only republished when a control differs
+        # (and retried on the next frame if a UI setter holds the lock)
+        if any(getattr(self, name) != value for name, value in changes.items()):
+            self._try_update_controls(**changes)
     
     def _compute_dmx_frame(self):
         """Compute the DMX channel values for current frame."""
-        data = array.array('B', [0] * config.DMX_CHANNELS)
+        data = self._new_frame()
         
         # Get current audio state
         audio_state = self.audio_analyzer.get_state()
@@ -515,37 +596,34 @@ class DmxController(BaseDmxController):
         self._apply_genre_adaptation(audio_state)
         
         # Handle build-up/drop detection
-        if audio_state.get('is_drop', False):
-            # EXPLOSION! Max everything briefly
-            self.beat_sensitivity = 1.0
-            self.strobe_level = 0.5
-        
-        # Process beat events
-        beat_occurred = False
-        while not self.beat_queue.empty():
-            try:
-                self.beat_queue.get_nowait()
-                beat_occurred = True
-                self.last_beat_time = time.time()
-            except:
-                break
+        if audio_state.get('is_drop', False) and (self.beat_sensitivity, self.strobe_level) != (1.0, 0.5):
+            # EXPLOSION! Max everything briefly (retried next frame if the lock is busy)
+            self._try_update_controls(beat_sensitivity=1.0, strobe_level=0.5)
+        
+        # Beat events were drained by _process_beats() before this frame
+        beat_occurred = self.beat_occurred
+        
+        # Snapshot controls once for the whole frame (no lock needed)
+        smoothness, _, brightness_control, strobe_level, pattern, _ = self._params
         
-        # Update colors
-        self._update_colors(beat_occurred, intensity)
+        # Update colors on this frame's tables; if the UI thread swaps in new
+        # ones meanwhile, the next frame picks them up
+        target_colors, current_colors = self._color_tables
+        self._update_colors(beat_occurred, intensity, target_colors, current_colors)
+        colors = lighting_kernel.color_rows(current_colors)
         
         # Apply colors to DMX channels
-        current_time = time.time()
+        current_time = time.monotonic()
         settings = config.LIGHTING_SETTINGS
         
+        # Per-light (brightness, r, g, b), converted to DMX values in one vectorized pass
+        light_values = []
+        
         # Only process active lights
         for i in range(self.active_lights):
-            fixture = config.LIGHT_FIXTURES[i]
-            base_channel = fixture['start_channel'] - 1
-            channels = fixture['channels']
-            
             # Multi-layer effects system
             # Layer 1: Base pattern-based color selection
-            r, g, b = self._apply_pattern(i, current_time)
+            r, g, b = self._apply_pattern(colors, i, current_time)
             
             # Layer 2: Frequency-based colors
             if self.spectrum_mode:
@@ -577,10 +655,10 @@ class DmxController(BaseDmxController):
                 brightness = min(1.0, freq_brightness * settings['brightness_base'])
                 beat_boost = 0
                 
-            elif self.pattern == "swell":
+            elif pattern == "swell":
                 # Swell pattern: synchronized undulation
                 # Update swell phase
-                swell_speed = 0.1 + (1.0 - self.smoothness) * 0.5  # 0.1 to 0.6 Hz
+                swell_speed = 0.1 + (1.0 - smoothness) * 0.5  # 0.1 to 0.6 Hz
                 self.swell_phase += swell_speed * (1.0 / config.UPDATE_FPS)
                 
                 # Create slow, deep undulation
@@ -601,12 +679,12 @@ class DmxController(BaseDmxController):
                     
                     # Beat flash duration based on smoothness and sensitivity
                     base_duration = settings['beat_flash_duration']
-                    if self.smoothness < 0.5:
+                    if smoothness < 0.5:
                         # Fast: 0.1 to 0.3 seconds
-                        beat_duration = base_duration * (0.2 + self.smoothness * 1.6)
+                        beat_duration = base_duration * (0.2 + smoothness * 1.6)
                     else:
                         # Slow: 0.3 to 2.0 seconds  
-                        beat_duration = base_duration * (1.0 + (self.smoothness - 0.5) * 6.0)
+                        beat_duration = base_duration * (1.0 + (smoothness - 0.5) * 6.0)
                     
                     # Extend duration based on beat sensitivity
                     beat_duration *= (0.5 + self.beat_sensitivity * 1.5)  # 0.5x to 2x duration
@@ -617,12 +695,12 @@ class DmxController(BaseDmxController):
                         base_response = 0.05 + (self.beat_sensitivity * 0.75)
                         
                         # Modulate by smoothness
-                        if self.smoothness < 0.5:
+                        if smoothness < 0.5:
                             # Fast mode: stronger response
-                            beat_response = base_response * (1.0 - self.smoothness * 0.3)
+                            beat_response = base_response * (1.0 - smoothness * 0.3)
                         else:
                             # Smooth mode: gentler response  
-                            beat_response = base_response * (0.7 - (self.smoothness - 0.5) * 0.4)
+                            beat_response = base_response * (0.7 - (smoothness - 0.5) * 0.4)
                         
                         beat_boost = beat_response * (1 - time_since_beat / beat_duration)
                 
@@ -635,12 +713,12 @@ class DmxController(BaseDmxController):
             # 0.0 = 5% brightness (very dim but still visible)
             # 0.5 = 100% brightness (normal) 
             # 1.0 = 120% brightness (boosted, clamped to prevent overflow)
-            if self.brightness_control < 0.5:
+            if brightness_control < 0.5:
                 # Dim range: 5% to 100% (increased minimum from 10% to 5% to prevent total darkness)
-                brightness_multiplier = 0.05 + (self.brightness_control * 2 * 0.95)
+                brightness_multiplier = 0.05 + (brightness_control * 2 * 0.95)
             else:
                 # Boost range: 100% to 120% (reduced from 150% to prevent overflow)
-                brightness_multiplier = 1.0 + ((self.brightness_control - 0.5) * 2 * 0.2)
+                brightness_multiplier = 1.0 + ((brightness_control - 0.5) * 2 * 0.2)
             
             brightness *= brightness_multiplier
             
@@ -650,49 +728,25 @@ class DmxController(BaseDmxController):
             # Clamp brightness to prevent DMX overflow
             brightness = min(1.0, brightness)
             
-            # Set DMX values with clamping and minimum floor
-            if 'dimmer' in channels:
-                # Ensure minimum value of 1 when brightness > 0 to prevent complete darkness
-                dimmer_value = int(brightness * 255)
-                if dimmer_value > 0:
-                    dimmer_value = max(1, dimmer_value)
-                data[base_channel + channels['dimmer']] = min(255, dimmer_value)
-                scale = 1.0
-            else:
-                scale = brightness
-            
-            if 'red' in channels:
-                red_value = int(r * scale)
-                if red_value > 0:
-                    red_value = max(1, red_value)  # Minimum of 1 when not zero
-                data[base_channel + channels['red']] = min(255, red_value)
-            if 'green' in channels:
-                green_value = int(g * scale)
-                if green_value > 0:
-                    green_value = max(1, green_value)  # Minimum of 1 when not zero
-                data[base_channel + channels['green']] = min(255, green_value)
-            if 'blue' in channels:
-                blue_value = int(b * scale)
-                if blue_value > 0:
-                    blue_value = max(1, blue_value)  # Minimum of 1 when not zero
-                data[base_channel + channels['blue']] = min(255, blue_value)
-            
-            # Apply strobe ONLY when explicitly set via strobe control
-            if 'strobe' in channels:
-                if self.strobe_level > 0.1:  # Only strobe when slider is actively set
-                    # Strobe frequency based on strobe level
-                    strobe_rate = self.strobe_level * 10  # 0 to 10 Hz
-                    if (current_time * strobe_rate) % 1.0 < 0.5:
-                        strobe_value = min(255, int(self.strobe_level * 255))
-                        data[base_channel + channels['strobe']] = strobe_value
-                    else:
-                        data[base_channel + channels['strobe']] = 0
-                else:
-                    # No strobe at all when slider is at/near zero
-                    data[base_channel + channels['strobe']] = 0
+            light_values.append((brightness, r, g, b))
+        
+        if light_values:
+            self._write_light_values(data, light_values, strobe_level, current_time)
         
         return data
     
+    def _write_light_values(self, data, light_values, strobe_level, current_time):
+        """Convert per-light brightness and color to DMX channel values."""
+        # Apply strobe ONLY when explicitly set via strobe control
+        strobe_value = 0
+        if strobe_level > 0.1:  # Only strobe when slider is actively set
+            # Strobe frequency based on strobe level
+            strobe_rate = strobe_level * 10  # 0 to 10 Hz
+            if (current_time * strobe_rate) % 1.0 < 0.5:
+                strobe_value = min(255, int(strobe_level * 255))
+        
+        lighting_kernel.fill_frame(data, self._channel_layout, light_values, len(light_values), strobe_value)
+    
     def _apply_mood_adjustment(self, r, g, b, intensity):
         """Adjust color temperature based on intensity (cool for low, warm for high)."""
         # Intensity ranges from 0.0 to 1.0
@@ -720,144 +774,131 @@ class DmxController(BaseDmxController):
         
         return r, g, b
     
-    def _apply_pattern(self, light_index, current_time):
-        """Apply pattern-based color selection for each light."""
-        if self.pattern == "sync":
-            # All lights show same color
-            return self.current_colors[light_index]
-            
-        elif self.pattern == "wave":
-            # Colors flow from left to right
-            wave_speed = 0.2 + (1.0 - self.smoothness) * 1.0  # Much slower: 0.2 to 1.2 speed
-            phase = (current_time * wave_speed + self.color_phases[light_index]) * 2 * 3.14159
-            
-            # Use sine wave for smooth transitions
-            wave_factor = (math.sin(phase) + 1.0) / 2.0  # 0 to 1
-            
-            # Blend between current and next color in palette
-            base_color = self.current_colors[light_index]
-            next_idx = (light_index + 1) % max(1, self.active_lights)
-            # Ensure we don't go out of bounds
-            if next_idx < len(self.current_colors):
-                next_color = self.current_colors[next_idx]
-            else:
-                next_color = self.current_colors[0]  # Wrap to first
-            
-            r = int(base_color[0] * (1 - wave_factor) + next_color[0] * wave_factor)
-            g = int(base_color[1] * (1 - wave_factor) + next_color[1] * wave_factor)
-            b = int(base_color[2] * (1 - wave_factor) + next_color[2] * wave_factor)
-            
-            return (r, g, b)
-            
-        elif self.pattern == "center":
-            # Center light(s) lead, outer lights follow
-            center_idx = self.active_lights // 2
-            if self.active_lights % 2 == 1:
-                # Odd number: single center
-                if light_index == center_idx:
-                    return self.current_colors[center_idx]
-            else:
-                # Even number: two center lights
-                if light_index == center_idx or light_index == center_idx - 1:
-                    return self.current_colors[light_index]
-            
-            # Outer lights mirror center with delay
-            delay_frames = int(10 * self.smoothness)
-            return self.current_colors[center_idx] if delay_frames == 0 else self.current_colors[light_index]
-                
-        elif self.pattern == "alternate":
-            # Lights alternate in groups
-            if self.active_lights <= 2:
-                # Simple alternation for 1-2 lights
-                beat_phase = int(current_time * 2) % 2
-                return self.current_colors[light_index] if beat_phase == 0 else (
-                    int(self.current_colors[light_index][0] * 0.3),
-                    int(self.current_colors[light_index][1] * 0.3),
-                    int(self.current_colors[light_index][2] * 0.3)
-                )
-            else:
-                # Group alternation for 3+ lights
-                beat_phase = int(current_time * 2) % 2
-                group = light_index % 2
-                if group == beat_phase:
-                    return self.current_colors[light_index]
-                else:
-                    r, g, b = self.current_colors[light_index]
-                    return (int(r * 0.3), int(g * 0.3), int(b * 0.3))
-                
-        elif self.pattern == "mirror":
-            # Lights mirror from center outward
-            if self.active_lights == 1:
-                return self.current_colors[0]
-            
-            # Calculate mirror pairs
-            mirror_point = self.active_lights / 2.0
-            if light_index < mirror_point:
-                # Left side
-                return self.current_colors[light_index]
+    def _pattern_sync(self, colors, light_index, current_time):
+        """All lights show their own current color in sync."""
+        return colors[light_index]
+        
+    def _pattern_wave(self, colors, light_index, current_time):
+        """Colors flow from left to right."""
+        wave_speed = 0.2 + (1.0 - self.smoothness) * 1.0  # Much slower: 0.2 to 1.2 speed
+        phase = (current_time * wave_speed + self.color_phases[light_index]) * 2 * 3.14159
+        
+        # Use sine wave for smooth transitions
+        wave_factor = (math.sin(phase) + 1.0) / 2.0  # 0 to 1
+        
+        # Blend between current and next color in palette
+        base_color = colors[light_index]
+        # The table already wraps, and colors has a row for every light
+        next_color = colors[_NEXT_LIGHT[max(1, self.active_lights)][light_index]]
+        
+        r = int(base_color[0] * (1 - wave_factor) + next_color[0] * wave_factor)
+        g = int(base_color[1] * (1 - wave_factor) + next_color[1] * wave_factor)
+        b = int(base_color[2] * (1 - wave_factor) + next_color[2] * wave_factor)
+        
+        return (r, g, b)
+        
+    def _pattern_center(self, colors, light_index, current_time):
+        """Center light(s) lead, outer lights follow."""
+        center_idx = self.active_lights // 2
+        if self.active_lights % 2 == 1:
+            # Odd number: single center
+            if light_index == center_idx:
+                return colors[center_idx]
+        else:
+            # Even number: two center lights
+            if light_index == center_idx or light_index == center_idx - 1:
+                return colors[light_index]
+        
+        # Outer lights mirror center with delay
+        delay_frames = int(10 * self.smoothness)
+        return colors[center_idx] if delay_frames == 0 else colors[light_index]
+        
+    def _pattern_alternate(self, colors, light_index, current_time):
+        """Lights alternate in groups."""
+        if self.active_lights <= 2:
+            # Simple alternation for 1-2 lights
+            beat_phase = int(current_time * 2) % 2
+            return colors[light_index] if beat_phase == 0 else (
+                int(colors[light_index][0] * 0.3),
+                int(colors[light_index][1] * 0.3),
+                int(colors[light_index][2] * 0.3)
+            )
+        else:
+            # Group alternation for 3+ lights
+            beat_phase = int(current_time * 2) % 2
+            group = light_index % 2
+            if group == beat_phase:
+                return colors[light_index]
             else:
-                # Right side mirrors left
-                mirror_idx = self.active_lights - 1 - light_index
-                return self.current_colors[mirror_idx]
-                
-        elif self.pattern == "swell":
-            # Synchronized undulation - all lights move together
-            # This will be handled differently in brightness calculation
-            # For now, return the same color for all lights with smooth transitions
-            return self.current_colors[light_index]
-                
+                r, g, b = colors[light_index]
+                return (int(r * 0.3), int(g * 0.3), int(b * 0.3))
+                
+    def _pattern_mirror(self, colors, light_index, current_time):
+        """Lights mirror from center outward."""
+        if self.active_lights == 1:
+            return colors[0]
+        
+        # Calculate mirror pairs
+        mirror_point = self.active_lights / 2.0
+        if light_index < mirror_point:
+            # Left side
+            return colors[light_index]
         else:
-            # Default to sync
-            return self.current_colors[light_index]
+            # Right side mirrors left
+            mirror_idx = self.active_lights - 1 - light_index
+            return colors[mirror_idx]
+            
+    def _pattern_swell(self, colors, light_index, current_time):
+        """Synchronized undulation - all lights move together."""
+        # This will be handled differently in brightness calculation
+        # For now, return the same color for all lights with smooth transitions
+        return colors[light_index]
     
-    def _update_colors(self, beat_occurred, intensity):
+    def _update_colors(self, beat_occurred, intensity, target_colors, current_colors):
         """Update color transitions based on rainbow level and beats."""
-        if self.control_lock.acquire(timeout=0.01):  # 10ms timeout
-            try:
-                current_time = time.time()
-                
-                # Apply BPM sync to timing
-                bpm_factor = 1.0 / max(0.1, self.bpm_sync)  # Invert: lower sync = slower changes
-                
-                # Special timing for swell pattern
-                if self.pattern == "swell":
-                    change_interval = (5.0 + self.smoothness * 10.0) * bpm_factor  # 5-15 seconds base
-                    change_on_beat = False  # No beat triggers for swell
-                # Spectrum mode - frequency-driven changes
-                elif self.spectrum_mode:
-                    change_interval = (3.0 + self.smoothness * 5.0) * bpm_factor  # 3-8 seconds base
-                    change_on_beat = False  # No beat triggers in spectrum mode
-                # Normal color transitions - MUCH FASTER
-                elif self.rainbow_level < 0.2:
-                    # Single color mode
-                    change_interval = (3.0 + self.smoothness * 5.0) * bpm_factor  # 3-8 seconds
-                    change_on_beat = False
-                elif self.rainbow_level < 0.5:
-                    # Moderate diversity
-                    change_interval = (2.0 + self.smoothness * 3.0) * bpm_factor  # 2-5 seconds
-                    change_on_beat = beat_occurred and intensity > 0.6
-                elif self.rainbow_level < 0.8:
-                    # High diversity
-                    change_interval = (1.0 + self.smoothness * 2.0) * bpm_factor  # 1-3 seconds
-                    change_on_beat = beat_occurred and intensity > 0.4
-                else:
-                    # Full rainbow - fast changes
-                    change_interval = (0.5 + self.smoothness * 1.0) * bpm_factor  # 0.5-1.5 seconds
-                    change_on_beat = beat_occurred
-                
-                # Check if it's time to change colors
-                time_to_change = current_time - self.last_color_change > change_interval
-                
-                if time_to_change or change_on_beat:
-                    self.last_color_change = current_time
-                    self._select_new_colors()
-                
-                # Update fade progress for smooth transitions
-                self._update_color_fades()
-            finally:
-                self.control_lock.release()
+        smoothness, rainbow_level, _, _, pattern, bpm_sync = self._params
+        current_time = time.monotonic()
+        
+        # Apply BPM sync to timing
+        bpm_factor = 1.0 / max(0.1, bpm_sync)  # Invert: lower sync = slower changes
+        
+        # Special timing for swell pattern
+        if pattern == "swell":
+            change_interval = (5.0 + smoothness * 10.0) * bpm_factor  # 5-15 seconds base
+            change_on_beat = False  # No beat triggers for swell
+        # Spectrum mode - frequency-driven changes
+        elif self.spectrum_mode:
+            change_interval = (3.0 + smoothness * 5.0) * bpm_factor  # 3-8 seconds base
+            change_on_beat = False  # No beat triggers in spectrum mode
+        # Normal color transitions - MUCH FASTER
+        elif rainbow_level < 0.2:
+            # Single color mode
+            change_interval = (3.0 + smoothness * 5.0) * bpm_factor  # 3-8 seconds
+            change_on_beat = False
+        elif rainbow_level < 0.5:
+            # Moderate diversity
+            change_interval = (2.0 + smoothness * 3.0) * bpm_factor  # 2-5 seconds
+            change_on_beat = beat_occurred and intensity > 0.6
+        elif rainbow_level < 0.8:
+            # High diversity
+            change_interval = (1.0 + smoothness * 2.0) * bpm_factor  # 1-3 seconds
+            change_on_beat = beat_occurred and intensity > 0.4
+        else:
+            # Full rainbow - fast changes
+            change_interval = (0.5 + smoothness * 1.0) * bpm_factor  # 0.5-1.5 seconds
+            change_on_beat = beat_occurred
+        
+        # Check if it's time to change colors
+        time_to_change = current_time - self.last_color_change > change_interval
+        
+        if time_to_change or change_on_beat:
+            self.last_color_change = current_time
+            self._select_new_colors(rainbow_level, target_colors)
+        
+        # Update fade progress for smooth transitions
+        self._update_color_fades(smoothness, bpm_sync, target_colors, current_colors)
     
-    def _select_new_colors(self):
+    def _select_new_colors(self, rainbow_level, target_colors):
         """Select new target colors based on rainbow level."""
         try:
             # Use selected color theme
@@ -869,45 +910,41 @@ class DmxController(BaseDmxController):
                 palette = [(255, 0, 0)]  # Default to red
                 palette_size = 1
             
-            if self.rainbow_level < 0.2:
+            if rainbow_level < 0.2:
                 # Single color mode - all lights same color
                 # Move to next color in palette
-                current_idx = 0
-                for color in palette:
-                    if color == self.target_colors[0]:
-                        current_idx = palette.index(color)
-                        break
+                current_color = tuple(target_colors[0])
+                current_idx = palette.index(current_color) if current_color in palette else 0
                 next_idx = (current_idx + 1) % palette_size
                 new_color = palette[next_idx]
                 
                 for i in range(self.active_lights):
-                    self.target_colors[i] = new_color
+                    target_colors[i] = new_color
                     self.color_fade_progress[i] = 0.0
                     
-            elif self.rainbow_level < 0.5:
+            elif rainbow_level < 0.5:
                 # Moderate diversity - lights have related colors
-                base_idx = random.randint(0, max(0, palette_size - 1))
+                base_idx = self._randidx(palette_size)
                 spread = max(1, int(palette_size * 0.3))  # Colors within 30% of palette, minimum 1
                 
                 for i in range(self.active_lights):
                     offset = i * spread // max(1, self.active_lights)
                     idx = (base_idx + offset) % palette_size
-                    self.target_colors[i] = palette[idx]
+                    target_colors[i] = palette[idx]
                     self.color_fade_progress[i] = 0.0
                     
-            elif self.rainbow_level < 0.8:
+            elif rainbow_level < 0.8:
                 # High diversity - lights have different colors
                 indices = []
                 spread = max(1, palette_size // 3)  # Ensure spread is at least 1
                 
                 for i in range(self.active_lights):
-                    # Ensure we don't go negative in random.randint
-                    random_offset = random.randint(0, max(0, spread-1))
+                    random_offset = self._randidx(spread)
                     idx = (i * spread + random_offset) % palette_size
                     indices.append(idx)
                 
                 for i in range(self.active_lights):
-                    self.target_colors[i] = palette[indices[i]]
+                    target_colors[i] = palette[indices[i]]
                     self.color_fade_progress[i] = 0.0
                     
             else:
@@ -926,44 +963,44 @@ class DmxController(BaseDmxController):
                 for i in range(self.active_lights):
                     # Use modulo to handle case where we have more lights than indices
                     idx = indices[i % len(indices)]
-                    self.target_colors[i] = palette[idx]
+                    target_colors[i] = palette[idx]
                     self.color_fade_progress[i] = 0.0
                     
         except Exception as e:
             # If any error occurs, just set all lights to a safe default
             print(f"Error in _select_new_colors: {e}")
             for i in range(self.active_lights):
-                self.target_colors[i] = (255, 0, 0)  # Default to red
+                target_colors[i] = (255, 0, 0)  # Default to red
                 self.color_fade_progress[i] = 0.0
     
-    def _update_color_fades(self):
+    def _randidx(self, n):
+        """Return a random index in [0, n) drawn from the pregenerated pool."""
+        v = self._rng_buf[self._rng_pos]
+        self._rng_pos += 1
+        if self._rng_pos == RNG_POOL_SIZE:
+            # Pool exhausted - refill in one vectorized call
+            self._rng_buf = self._rng.random(RNG_POOL_SIZE).tolist()
+            self._rng_pos = 0
+        return int(v * n)
+    
+    def _update_color_fades(self, smoothness, bpm_sync, target_colors, current_colors):
         """Update the fade progress for color transitions."""
         # Simpler, faster fade speed calculation
         # Apply BPM sync to fade speed too
-        bpm_factor = max(0.1, self.bpm_sync)
+        bpm_factor = max(0.1, bpm_sync)
         
         # Smoothness 0.0 = instant changes
         # Smoothness 0.5 = balanced (0.5 second fade)
         # Smoothness 1.0 = slow (2 second fade)
-        fade_time = 0.1 + self.smoothness * 1.9  # 0.1 to 2.0 seconds
+        fade_time = 0.1 + smoothness * 1.9  # 0.1 to 2.0 seconds
         fade_speed = (1.0 / (fade_time * config.UPDATE_FPS)) * bpm_factor
         
         # Update ALL active lights, not just 3
-        for i in range(self.active_lights):
-            if self.color_fade_progress[i] < 1.0:
-                self.color_fade_progress[i] = min(1.0, self.color_fade_progress[i] + fade_speed)
-                
-                # Interpolate between current and target colors
-                r_current, g_current, b_current = self.current_colors[i]
-                r_target, g_target, b_target = self.target_colors[i]
-                
-                progress = self.color_fade_progress[i]
-                # Smooth ease-in-out interpolation
-                smooth_progress = 0.5 - 0.5 * math.cos(progress * math.pi)
-                
-                self.current_colors[i] = (
-                    int(r_current + (r_target - r_current) * smooth_progress),
-                    int(g_current + (g_target - g_current) * smooth_progress),
-                    int(b_current + (b_target - b_current) * smooth_progress)
-                )
+        lighting_kernel.update_color_fades(
+            current_colors,
+            target_colors,
+            self.color_fade_progress,
+            self.active_lights,
+            fade_speed
+        )
     
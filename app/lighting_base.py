@@ -3,12 +3,27 @@ Base DMX controller class with shared functionality for Simple and Advanced mode
 """
 
 import array
+import os
 import threading
 import time
+from collections import deque
 from ola.ClientWrapper import ClientWrapper
 import config
 
 
+# Fixture channels written per light, in column order of the channel layout
+LAYOUT_CHANNELS = ('dimmer', 'red', 'green', 'blue', 'strobe')
+
+# Seconds between resends of an unchanged frame
+DMX_KEEPALIVE_INTERVAL = 1.0
+
+# All-zero frame, shared for clearing the frame buffer and the exit blackout
+BLACKOUT = bytes(config.DMX_CHANNELS)
+
+# Number of recent frame intervals kept for the debug jitter report
+JITTER_WINDOW = 128
+
+
 class BaseDmxController:
     """Base class for DMX lighting control."""
     
@@ -18,7 +33,7 @@ class BaseDmxController:
         
         Args:
             audio_analyzer: Reference to audio analyzer for state access
-            beat_queue: Queue for beat events from audio module
+            beat_queue: Deque of beat events from audio module
             stop_event: Threading event to signal shutdown
         """
         self.audio_analyzer = audio_analyzer
@@ -33,16 +48,39 @@ class BaseDmxController:
         self.ola_client = None
         self.wrapper = None
         
-        # DMX state
-        self.dmx_data = array.array('B', [0] * config.DMX_CHANNELS)
+        # DMX state - frames are built in a reusable bytearray (cheap item
+        # writes, shares memory with NumPy views) and copied into a persistent
+        # array.array for OLA, which serializes via array.tobytes()
+        self._frame_buf = bytearray(config.DMX_CHANNELS)
+        self._frame_view = memoryview(self._frame_buf)
+        self._send_arr = array.array('B', BLACKOUT)
+        self._send_view = memoryview(self._send_arr)
+        self._last_send_time = 0
         self.active_lights = config.DEFAULT_LIGHT_COUNT
         
+        # Absolute DMX offsets for each fixture's layout channels (-1 if absent)
+        self._channel_layout = self._build_channel_layout()
+        
         # Beat tracking
         self.last_beat_time = 0
         self.beat_occurred = False
         
         # DMX frame update interval (milliseconds)
         self.update_interval = int(1000 / config.UPDATE_FPS)
+        self._frame_count = 0
+        
+        # Frame deadlines on the monotonic clock, so reactor delays don't accumulate
+        self._frame_period = 1.0 / config.UPDATE_FPS
+        self._next_deadline = 0.0
+        self._last_tick = None
+        self._intervals = deque(maxlen=JITTER_WINDOW)
+        
+        # Bound once so the per-frame OLA calls don't create new method objects
+        self._tick_callback = self._dmx_tick
+        self._sent_callback = self._dmx_sent
+        
+        # Periodic frame diagnostics are off unless DMX_DEBUG=1 is set
+        self._debug = os.environ.get('DMX_DEBUG') == '1'
         
     def start(self):
         """Start the DMX control thread."""
@@ -77,70 +115,149 @@ class BaseDmxController:
             print("DMX control disabled - OLA not available")
             return
             
+        self._tune_scheduling()
+        
         print(f"DMX controller started on universe {config.DMX_UNIVERSE}")
         print(f"Active lights: {self.active_lights}")
-        last_update = time.time()
-        frame_count = 0
+        self._frame_count = 0
+        self._last_tick = None
+        self._next_deadline = time.monotonic() + self._frame_period
         
+        # Frames are driven by one long-lived OLA reactor: each tick re-arms
+        # itself with AddEvent and Run() blocks until the tick calls Stop()
         print("Entering main DMX loop...")
-        while not self.stop_event.is_set():
-            try:
-                current_time = time.time()
-                
-                # Check for beats
-                self._process_beats()
-                
-                # Compute frame at target FPS
-                if (current_time - last_update) * 1000 >= self.update_interval:
-                    dmx_frame = self._compute_dmx_frame()
-                    
-                    # Debug on first frame and then periodically
-                    if frame_count == 0:
-                        print(f"First DMX frame computed, length: {len(dmx_frame)}")
-                        if self.active_lights > 0 and len(dmx_frame) >= 7:
-                            sample = list(dmx_frame[0:7])
-                            print(f"First frame L1: Dim={sample[0]}, R={sample[1]}, G={sample[2]}, B={sample[3]}")
-                    
-                    self._send_dmx(dmx_frame)
-                    last_update = current_time
-                    frame_count += 1
-                    
-                    # Debug output every 30 frames (1 second at 30fps) for now
-                    if frame_count % 30 == 0:
-                        print(f"DMX frames sent: {frame_count}")
-                    
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.001)
-                
-            except Exception as e:
-                print(f"DMX loop error: {e}")
-                time.sleep(0.1)
+        self.wrapper.AddEvent(self.update_interval, self._tick_callback)
+        self.wrapper.Run()
                 
         # Send blackout on exit
-        self._send_dmx(array.array('B', [0] * config.DMX_CHANNELS))
+        self._send_dmx(BLACKOUT, force=True)
         print("DMX controller stopped")
         
+    def _dmx_tick(self):
+        """Compute and send one DMX frame, then schedule the next tick."""
+        if self.stop_event.is_set():
+            self.wrapper.Stop()
+            return
+        
+        now = time.monotonic()
+        if self._last_tick is not None:
+            self._intervals.append(now - self._last_tick)
+        self._last_tick = now
+        
+        # Aim at the next fixed deadline rather than "now + interval" so late
+        # wakeups are made up; resync if we fell more than a frame behind
+        self._next_deadline += self._frame_period
+        if self._next_deadline < now:
+            self._next_deadline = now + self._frame_period
+        delay_ms = max(1, int((self._next_deadline - now) * 1000))
+        self.wrapper.AddEvent(delay_ms, self._tick_callback)
+        
+        try:
+            # Check for beats
+            self._process_beats()
+            
+            dmx_frame = self._compute_dmx_frame()
+            
+            # Debug on first frame and then periodically
+            if self._debug and self._frame_count == 0:
+                print(f"First DMX frame computed, length: {len(dmx_frame)}")
+                if self.active_lights > 0 and len(dmx_frame) >= 7:
+                    print(f"First frame L1 (dim r g b strobe mode speed): {dmx_frame[0:7].hex(' ')}")
+            
+            self._send_dmx(dmx_frame)
+            self._frame_count += 1
+            
+            # Debug output sampled every 30 frames (1 second at 30fps)
+            if self._debug and self._frame_count % 30 == 0:
+                lit = bytes(dmx_frame).count(0) < len(dmx_frame)
+                print(f"DMX frames sent: {self._frame_count} ({'lit' if lit else 'dark'}, "
+                      f"p95 interval {self._interval_p95() * 1000:.1f} ms)")
+                
+        except Exception as e:
+            print(f"DMX loop error: {e}")
+            
+    def _interval_p95(self):
+        """95th percentile of recent frame intervals in seconds (0 if none yet)."""
+        if not self._intervals:
+            return 0.0
+        ordered = sorted(self._intervals)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+        
+    def _tune_scheduling(self):
+        """
+        Pin the DMX thread to its own core and give it real-time priority.
+        
+        Frame cadence on a Raspberry Pi is limited by scheduling jitter from
+        the audio and GUI threads rather than by compute. Both settings apply
+        to the calling thread only and are skipped where unsupported or not
+        permitted (SCHED_FIFO needs CAP_SYS_NICE).
+        """
+        cpu = config.DMX_CPU
+        if cpu is not None and hasattr(os, 'sched_setaffinity') and cpu < (os.cpu_count() or 1):
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except OSError as e:
+                print(f"Could not pin DMX thread to CPU {cpu}: {e}")
+                
+        priority = config.DMX_RT_PRIORITY
+        if priority is not None and hasattr(os, 'sched_setscheduler'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            except PermissionError:
+                pass  # No CAP_SYS_NICE - keep normal scheduling
+            except OSError as e:
+                print(f"Could not set DMX thread priority: {e}")
+                
     def _process_beats(self):
         """Process beat events from queue."""
-        self.beat_occurred = False
-        while not self.beat_queue.empty():
-            try:
-                beat_data = self.beat_queue.get_nowait()
-                self.beat_occurred = True
-                self.last_beat_time = time.time()
-            except:
-                break
+        self.beat_occurred = bool(self.beat_queue)
+        if self.beat_occurred:
+            self.beat_queue.clear()
+            self.last_beat_time = time.monotonic()
                 
+    def _new_frame(self):
+        """Clear and return the shared frame buffer (valid until the next call)."""
+        self._frame_view[:] = BLACKOUT
+        return self._frame_buf
+        
     def _compute_dmx_frame(self):
         """Compute the DMX channel values for current frame. Override in subclass."""
-        return array.array('B', [0] * config.DMX_CHANNELS)
+        return self._new_frame()
+        
+    def _send_dmx(self, data, force=False):
+        """
+        Send DMX data to OLA.
         
-    def _send_dmx(self, data):
-        """Send DMX data to OLA."""
+        Frames identical to the last one sent are skipped (OLA holds the
+        last value on the wire), apart from a periodic keepalive resend.
+        
+        Args:
+            data: DMX frame buffer
+            force: Send even if the frame is unchanged
+        """
         if self.ola_client:
-            self.ola_client.SendDmx(config.DMX_UNIVERSE, data, self._dmx_sent)
-            self.wrapper.RunOnce()  # Use RunOnce instead of Run to avoid blocking
+            now = time.monotonic()
+            if (not force and self._send_view == data and
+                    now - self._last_send_time < DMX_KEEPALIVE_INTERVAL):
+                return
+            self._last_send_time = now
             
+            # One memcpy into the array OLA expects
+            self._send_view[:] = data
+            self.ola_client.SendDmx(config.DMX_UNIVERSE, self._send_arr, self._sent_callback)
+            
+    def _build_channel_layout(self):
+        """Build a list of absolute DMX offset tuples, one row per fixture."""
+        layout = []
+        for fixture in config.LIGHT_FIXTURES:
+            base_channel = fixture['start_channel'] - 1
+            channels = fixture['channels']
+            layout.append(tuple(
+                base_channel + channels[name] if name in channels else -1
+                for name in LAYOUT_CHANNELS
+            ))
+        return layout
+        
     def _dmx_sent(self, status):
         """Callback for DMX send completion."""
         if not status.Succeeded():
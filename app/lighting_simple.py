@@ -2,7 +2,6 @@
 Simple mode DMX controller with preset programs.
 """
 
-import array
 import math
 import random
 import time
@@ -242,7 +241,7 @@ class SimpleDmxController(BaseDmxController):
         
     def _compute_dmx_frame(self):
         """Compute DMX frame based on current program."""
-        data = array.array('B', [0] * config.DMX_CHANNELS)
+        data = self._new_frame()
         
         # Get current audio state
         audio_state = self.audio_analyzer.get_state()
@@ -1382,7 +1381,7 @@ class SimpleDmxController(BaseDmxController):
         if should_switch and new_program != self.dj_current_program:
             self.dj_current_program = new_program
             self.dj_program_beats = 0
-            self.dj_last_switch_time = time.time()
+            self.dj_last_switch_time = time.monotonic()
             
             # Reset some states for smooth transition
             self.bounce_position = 0
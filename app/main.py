@@ -6,10 +6,9 @@ Coordinates audio analysis, DMX control, and GUI modules.
 
 import sys
 import threading
-import queue
 import signal
-import time
 import argparse
+from collections import deque
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -19,7 +18,6 @@ import config
 from audio import AudioAnalyzer
 from lighting_simple import SimpleDmxController
 from lighting_advanced import DmxController as AdvancedDmxController
-from ui import MainUI
 
 
 class AudioReactiveLightingSystem:
@@ -34,7 +32,8 @@ class AudioReactiveLightingSystem:
         
         # Thread synchronization
         self.state_lock = threading.Lock()
-        self.beat_queue = queue.Queue()
+        # Bounded single-producer beat deque (append/clear are atomic under the GIL)
+        self.beat_queue = deque(maxlen=16)
         self.stop_event = threading.Event()
         
         # System components
@@ -89,6 +88,9 @@ class AudioReactiveLightingSystem:
             print("Advanced DMX controller initialized")
             
             if not self.headless:
+                # Imported here so headless runs never load Tk
+                from ui import MainUI
+                
                 # Initialize and run GUI (blocks until window closed)
                 print("Starting GUI...")
                 self.gui = MainUI(
@@ -102,8 +104,8 @@ class AudioReactiveLightingSystem:
                 # Headless mode - just wait for stop signal
                 print("Running in headless mode. Press Ctrl+C to stop.")
                 try:
-                    while not self.stop_event.is_set():
-                        time.sleep(1)
+                    # Wait on the event so a stop request returns immediately
+                    while not self.stop_event.wait(1):
                         # Print status periodically in headless mode
                         state = self.audio_analyzer.get_state()
                         print(f"BPM: {state['bpm']:.1f} | "
@@ -126,6 +128,10 @@ class AudioReactiveLightingSystem:
         # Signal all threads to stop
         self.stop_event.set()
         
+        # Close the GUI through Tk's own destroy path
+        if self.gui:
+            self.gui.request_shutdown()
+        
         # Stop components in reverse order
         if self.simple_controller:
             print("Stopping Simple DMX controller...")
@@ -177,6 +183,41 @@ def check_dependencies():
     return True
 
 
+def check_ola(timeout_ms=500):
+    """
+    Check that the OLA daemon answers a request.
+    
+    The reply callback only fires while the wrapper's event loop runs, so
+    the loop is run until the reply arrives or the timeout stops it.
+    
+    Args:
+        timeout_ms: How long to wait for olad to reply
+        
+    Returns:
+        True if olad replied successfully within the timeout
+    """
+    try:
+        from ola.ClientWrapper import ClientWrapper
+        wrapper = ClientWrapper()
+    except Exception:
+        return False
+    
+    replied = threading.Event()
+    
+    def on_universes(status, universes):
+        if status.Succeeded():
+            replied.set()
+        wrapper.Stop()
+    
+    try:
+        wrapper.Client().FetchUniverses(on_universes)
+        wrapper.AddEvent(timeout_ms, wrapper.Stop)
+        wrapper.Run()
+    except Exception:
+        return False
+    return replied.is_set()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -202,12 +243,7 @@ def main():
         sys.exit(0 if args.check_deps and check_dependencies() else 1)
     
     # Check if OLA daemon is running
-    try:
-        from ola.ClientWrapper import ClientWrapper
-        wrapper = ClientWrapper()
-        # This will fail if olad is not running
-        wrapper.Stop()
-    except:
+    if not check_ola():
         print("Warning: OLA daemon (olad) does not appear to be running.")
         print("Start it with: sudo olad")
         print("Configure DMX dongle at: http://localhost:9090")
@@ -4,12 +4,12 @@ Main UI wrapper with mode switching between Simple and Advanced modes.
 
 import tkinter as tk
 from tkinter import ttk
-import config
+from ui_base import BaseWindowUI
 from ui_simple import SimpleUI
 from ui_advanced import AudioReactiveLightingGUI as AdvancedUI
 
 
-class MainUI:
+class MainUI(BaseWindowUI):
     """Main UI with mode switching capability."""
     
     def __init__(self, audio_analyzer, simple_controller, advanced_controller, stop_event):
@@ -32,24 +32,7 @@ class MainUI:
         self.current_ui = None
         
         # Create main window
-        self.root = tk.Tk()
-        self.root.title("Lightshow Control")
-        
-        # Set window size
-        if config.FULLSCREEN:
-            self.root.attributes('-fullscreen', True)
-            self.root.bind('<Escape>', lambda e: self._on_quit())
-            self.root.bind('<q>', lambda e: self._on_quit())
-            self.root.bind('<Q>', lambda e: self._on_quit())
-        else:
-            self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
-            
-        # Configure window close handler
-        self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
-        
-        # Style configuration
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        self._create_window("Lightshow Control")
         
         # Create main container
         self.main_container = ttk.Frame(self.root)
@@ -65,6 +48,8 @@ class MainUI:
         # Load initial UI (simple mode)
         self._switch_to_simple()
         
+        self._show_window()
+        
     def _create_mode_selector(self):
         """Create the mode selection controls at the top."""
         # Mode selector frame
@@ -103,7 +88,7 @@ class MainUI:
         self.quit_button = ttk.Button(
             mode_frame,
             text="Quit",
-            command=self._on_quit
+            command=self._on_closing
         )
         self.quit_button.pack(side=tk.RIGHT, padx=(0, 10))
         
@@ -161,57 +146,16 @@ class MainUI:
         if self.advanced_controller and not hasattr(self.advanced_controller, 'thread'):
             self.advanced_controller.start()
             
-        # Create advanced UI (it creates its own window structure)
-        # We need to embed it in our content frame
+        # Create advanced UI embedded in our content frame
         self._create_embedded_advanced_ui()
         
     def _create_embedded_advanced_ui(self):
         """Create advanced UI embedded in content frame."""
-        # The advanced UI expects to create its own window, so we need to adapt it
-        # For now, we'll create a simplified version that works with our frame
-        
-        # Import the advanced UI module
-        from ui_advanced import AudioReactiveLightingGUI
-        
-        # Create instance but prevent it from creating its own window
-        class EmbeddedAdvancedUI:
-            def __init__(self, parent_frame, audio_analyzer, dmx_controller, stop_event):
-                self.audio_analyzer = audio_analyzer
-                self.dmx_controller = dmx_controller
-                self.stop_event = stop_event
-                self.root = parent_frame  # Use our frame as root
-                
-                # Copy the widget creation from advanced UI
-                advanced = AudioReactiveLightingGUI.__new__(AudioReactiveLightingGUI)
-                advanced.audio_analyzer = audio_analyzer
-                advanced.dmx_controller = dmx_controller
-                advanced.stop_event = stop_event
-                advanced.root = parent_frame
-                
-                # Call the widget creation method
-                advanced._create_widgets()
-                advanced._initialize_controller()
-                
-                # Store reference
-                self.advanced_ui = advanced
-                
-                # Start updates
-                self._schedule_update()
-                
-            def _schedule_update(self):
-                if hasattr(self, 'advanced_ui'):
-                    self.advanced_ui._update_display()
-                if not self.stop_event.is_set():
-                    self.root.after(config.GUI_UPDATE_INTERVAL, self._schedule_update)
-                    
-            def destroy(self):
-                pass
-                
-        self.current_ui = EmbeddedAdvancedUI(
-            self.content_frame,
+        self.current_ui = AdvancedUI(
             self.audio_analyzer,
             self.advanced_controller,
-            self.stop_event
+            self.stop_event,
+            parent=self.content_frame
         )
         
     def _clear_content_frame(self):
@@ -222,16 +166,10 @@ class MainUI:
         for widget in self.content_frame.winfo_children():
             widget.destroy()
             
-    def _on_quit(self):
-        """Handle quit button click."""
-        self.stop_event.set()
-        self.root.after(500, self.root.destroy)
-        
-    def _on_closing(self):
-        """Handle window close event."""
+    def _on_closing(self, event=None):
+        """Handle quit button, quit keys, window close and shutdown requests."""
         self.stop_event.set()
+        # Detach the current UI from the analyzer before its widgets go away
+        if self.current_ui and hasattr(self.current_ui, 'destroy'):
+            self.current_ui.destroy()
         self.root.destroy()
-        
-    def run(self):
-        """Start the GUI main loop."""
-        self.root.mainloop()
\ No newline at end of file
@@ -4,12 +4,52 @@ Tkinter GUI module for displaying status and controls.
 
 import tkinter as tk
 from tkinter import ttk
-import threading
+from tkinter import font as tkfont
+from functools import partial
 import config
+from ui_base import BaseWindowUI, BPM_TEXT, PERCENT_TEXT, INDICATOR_ACTIVE, INDICATOR_IDLE
 
 
-class AudioReactiveLightingGUI:
-    def __init__(self, audio_analyzer, dmx_controller, stop_event):
+# Minimum interval between controller updates while a slider is dragged (~30 Hz)
+SLIDER_FLUSH_MS = 33
+
+# Slider rows per tab: (column, label, variable attribute, change handler,
+# initial value, left label, right label)
+MAIN_SLIDERS = (
+    ('left', "Speed", 'smoothness_var', '_on_smoothness_change', 0.5, "Slow", "Fast"),  # 0.5 = 50% smoothness (inverted)
+    ('left', "Rainbow", 'rainbow_var', '_on_rainbow_change', 0.5, "Single", "Full"),
+    ('left', "Brightness", 'brightness_var', '_on_brightness_change', 0.5, "Dim", "Bright"),
+    ('right', "Strobe", 'strobe_var', '_on_strobe_change', 0.0, "Off", "Max"),
+    ('right', "Beat Sens", 'beat_sensitivity_var', '_on_beat_sensitivity_change', 0.5, "Subtle", "Intense"),
+)
+EFFECTS_SLIDERS = (
+    ('left', "Chaos", 'chaos_var', '_on_chaos_change', 0.0, "None", "Wild"),
+    ('left', "Echo", 'echo_var', '_on_echo_length_change', 0.0, "Off", "Long"),
+)
+
+# Dropdown label -> controller value, resolved once here instead of
+# transforming the label string on every selection
+PATTERNS = {label: label.lower() for label in ("Sync", "Wave", "Center", "Alternate", "Mirror", "Swell")}
+THEMES = {label: label.lower() for label in ("Default", "Sunset", "Ocean", "Fire", "Forest", "Galaxy", "Mono", "Warm", "Cool")}
+THEMES["Mono"] = 'monochrome'  # Short label keeps the dropdown narrow
+EFFECTS = {label: label.lower() for label in ("None", "Breathe", "Sparkle", "Chase", "Pulse", "Sweep", "Firefly")}
+# BPM sync multiplier is the inverse of the beat division (every 2 beats = 0.5)
+BPM_SYNC_RATES = {label: 1.0 / division for label, division in config.BPM_SYNC_DIVISIONS.items()}
+
+# Frequency level bars: fixed-size canvases whose fill rectangle is resized,
+# with the fill width for each percentage precomputed
+LEVEL_BAR_WIDTH = 150
+LEVEL_BAR_HEIGHT = 14
+LEVEL_BAR_WIDTHS = tuple(round(i * LEVEL_BAR_WIDTH / 100) for i in range(101))
+
+# Tcl helper that runs each argument (a command word list) in turn, so one
+# tk.call applies all of a tick's widget updates
+BATCH_PROC = 'lightshow_batch'
+BATCH_PROC_SCRIPT = 'proc lightshow_batch {args} { foreach cmd $args { uplevel #0 $cmd } }'
+
+
+class AudioReactiveLightingGUI(BaseWindowUI):
+    def __init__(self, audio_analyzer, dmx_controller, stop_event, parent=None):
         """
         Initialize the GUI.
         
@@ -17,45 +57,63 @@ class AudioReactiveLightingGUI:
             audio_analyzer: Reference to audio analyzer for state access
             dmx_controller: Reference to DMX controller for mode changes
             stop_event: Threading event to signal shutdown
+            parent: Frame to build the controls in (None for a standalone window)
         """
         self.audio_analyzer = audio_analyzer
         self.dmx_controller = dmx_controller
         self.stop_event = stop_event
+        self.standalone = parent is None
         
-        # Create main window
-        self.root = tk.Tk()
-        self.root.title("Lightshow")
-        
-        # Set window size
-        if config.FULLSCREEN:
-            self.root.attributes('-fullscreen', True)
-            # Bind multiple keys to exit for safety
-            self.root.bind('<Escape>', lambda e: self._on_quit())
-            self.root.bind('<q>', lambda e: self._on_quit())
-            self.root.bind('<Q>', lambda e: self._on_quit())
-            # Allow Alt+Tab to work
-            self.root.attributes('-topmost', False)
-            # Don't grab exclusive focus
-            self.root.focus_set()
-            # Cursor is visible by default
+        if self.standalone:
+            self._create_window()
         else:
-            self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
+            self.root = parent
         
-        # Configure window close handler
-        self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        # Last values rendered by _update_display (None forces the first draw)
+        self._last = dict.fromkeys(
+            ('version', 'bpm', 'intensity', 'active', 'bass', 'mid', 'high', 'genre', 'event')
+        )
         
-        # Style configuration
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+        # Named fonts shared by all widgets, so Tk resolves each font once
+        # instead of parsing a font tuple per widget
+        self.font_small = tkfont.Font(root=self.root, family='Arial', size=8)
+        self.font_small_bold = tkfont.Font(root=self.root, family='Arial', size=8, weight='bold')
+        self.font_normal = tkfont.Font(root=self.root, family='Arial', size=9)
+        self.font_normal_bold = tkfont.Font(root=self.root, family='Arial', size=9, weight='bold')
+        self.font_large = tkfont.Font(root=self.root, family='Arial', size=10)
+        self.font_large_bold = tkfont.Font(root=self.root, family='Arial', size=10, weight='bold')
+        
+        # Tcl proc that runs a tick's batched widget updates in one call
+        self.root.tk.eval(BATCH_PROC_SCRIPT)
+        
+        # Slider values waiting to be pushed to the controller (setter name -> value)
+        self._pending_slider = {}
+        self._slider_flush_scheduled = False
+        self._suppress_slider_traces = False
+        # (variable, trace id) pairs, removed again in _stop_updates
+        self._slider_traces = []
         
         # Create UI elements
         self._create_widgets()
         
+        if self.standalone:
+            self._show_window()
+        
         # Initialize DMX controller with UI default values
         self._initialize_controller()
         
-        # Start periodic updates
-        self._schedule_update()
+        # Start analyzer-driven updates
+        self._start_updates()
+    
+    def _create_window(self):
+        """Create and configure the top-level window for standalone use."""
+        super()._create_window("Lightshow")
+        
+        if config.FULLSCREEN:
+            # Allow Alt+Tab to work
+            self.root.attributes('-topmost', False)
+            # Don't grab exclusive focus
+            self.root.focus_set()
     
     def _create_widgets(self):
         """Create all GUI widgets with tabbed interface for 320x480 screen."""
@@ -75,24 +133,24 @@ class AudioReactiveLightingGUI:
         )
         
         # Status text (smaller font)
-        self.status_text = ttk.Label(status_frame, text="No Audio", font=('Arial', 8))
+        self.status_text = ttk.Label(status_frame, text="No Audio", font=self.font_small)
         self.status_text.pack(side=tk.LEFT, padx=(0, 8))
         
         # BPM
-        ttk.Label(status_frame, text="BPM:", font=('Arial', 8, 'bold')).pack(side=tk.LEFT)
-        self.bpm_label = ttk.Label(status_frame, text="0", font=('Arial', 8))
+        ttk.Label(status_frame, text="BPM:", font=self.font_small_bold).pack(side=tk.LEFT)
+        self.bpm_label = ttk.Label(status_frame, text="0", font=self.font_small)
         self.bpm_label.pack(side=tk.LEFT, padx=(2, 8))
         
         # Level
-        ttk.Label(status_frame, text="Level:", font=('Arial', 8, 'bold')).pack(side=tk.LEFT)
-        self.intensity_label = ttk.Label(status_frame, text="0%", font=('Arial', 8))
+        ttk.Label(status_frame, text="Level:", font=self.font_small_bold).pack(side=tk.LEFT)
+        self.intensity_label = ttk.Label(status_frame, text="0%", font=self.font_small)
         self.intensity_label.pack(side=tk.LEFT, padx=(2, 0))
         
         # Quit button (right side)
         self.quit_button = ttk.Button(
             status_frame,
             text="X",
-            command=self._on_quit,
+            command=self._on_closing,
             width=2
         )
         self.quit_button.pack(side=tk.RIGHT)
@@ -120,7 +178,7 @@ class AudioReactiveLightingGUI:
         self.info_label = ttk.Label(
             main_frame,
             text=f"{config.DEFAULT_LIGHT_COUNT} PAR • DMX 1",
-            font=('Arial', 8),
+            font=self.font_small,
             foreground='gray'
         )
         self.info_label.pack(side=tk.BOTTOM, pady=(2, 0))
@@ -142,55 +200,23 @@ class AudioReactiveLightingGUI:
         right_col = ttk.Frame(controls_container)
         right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(3, 0))
         
-        # Speed control (left column) - balanced default
-        self._create_slider_control(
-            left_col, "Speed", 
-            self._on_smoothness_change,
-            0.5, "Slow", "Fast"  # 0.5 = 50% smoothness (inverted)
-        )
-        
-        # Rainbow control (left column) - more diversity
-        self._create_slider_control(
-            left_col, "Rainbow",
-            self._on_rainbow_change,
-            0.5, "Single", "Full"  # 0.5 = 50% rainbow
-        )
-        
-        # Brightness control (left column)
-        self._create_slider_control(
-            left_col, "Brightness",
-            self._on_brightness_change,
-            0.5, "Dim", "Bright"
-        )
-        
-        # Strobe control (right column)
-        self._create_slider_control(
-            right_col, "Strobe",
-            self._on_strobe_change,
-            0.0, "Off", "Max"
-        )
-        
-        # Beat Sensitivity control (right column) - default to balanced
-        self._create_slider_control(
-            right_col, "Beat Sens",
-            self._on_beat_sensitivity_change,
-            0.5, "Subtle", "Intense"  # 0.5 = 50% sensitivity
-        )
+        # Speed, Rainbow, Brightness (left); Strobe, Beat Sens (right)
+        self._create_sliders(MAIN_SLIDERS, left_col, right_col)
         
         # BPM Sync control (left column) - beat divisions
         bpm_frame = ttk.Frame(left_col)
         bpm_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(bpm_frame, text="BPM Sync:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(bpm_frame, text="BPM Sync:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         self.bpm_sync_var = tk.StringVar(value="Every beat")
         self.bpm_sync_combo = ttk.Combobox(
             bpm_frame,
             textvariable=self.bpm_sync_var,
-            values=["Every beat", "Every 2 beats", "Every 4 beats", "Every 8 beats", "Every 16 beats"],
+            values=list(BPM_SYNC_RATES),
             state="readonly",
             width=12,
-            font=('Arial', 9)
+            font=self.font_normal
         )
         self.bpm_sync_combo.pack(fill=tk.X, pady=(2, 0))
         self.bpm_sync_combo.bind("<<ComboboxSelected>>", self._on_bpm_sync_change)
@@ -199,16 +225,16 @@ class AudioReactiveLightingGUI:
         pattern_frame = ttk.Frame(right_col)
         pattern_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(pattern_frame, text="Pattern:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(pattern_frame, text="Pattern:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         self.pattern_var = tk.StringVar(value="Wave")  # Default to wave for motion
         self.pattern_combo = ttk.Combobox(
             pattern_frame,
             textvariable=self.pattern_var,
-            values=["Sync", "Wave", "Center", "Alternate", "Mirror", "Swell"],
+            values=list(PATTERNS),
             state="readonly",
             width=12,
-            font=('Arial', 9)
+            font=self.font_normal
         )
         self.pattern_combo.pack(fill=tk.X, pady=(2, 0))
         self.pattern_combo.bind("<<ComboboxSelected>>", self._on_pattern_change)
@@ -217,7 +243,7 @@ class AudioReactiveLightingGUI:
         lights_frame = ttk.Frame(left_col)
         lights_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(lights_frame, text="Lights:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(lights_frame, text="Lights:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         # Light count spinner frame
         spinner_frame = ttk.Frame(lights_frame)
@@ -237,7 +263,7 @@ class AudioReactiveLightingGUI:
         self.light_count_label = ttk.Label(
             spinner_frame,
             text=str(config.DEFAULT_LIGHT_COUNT),
-            font=('Arial', 10, 'bold'),
+            font=self.font_large_bold,
             width=3
         )
         self.light_count_label.pack(side=tk.LEFT, padx=(0, 5))
@@ -254,7 +280,7 @@ class AudioReactiveLightingGUI:
         ttk.Label(
             spinner_frame,
             text=f"(1-{config.MAX_LIGHTS})",
-            font=('Arial', 8),
+            font=self.font_small,
             foreground='gray'
         ).pack(side=tk.LEFT, padx=(10, 0))
     
@@ -275,34 +301,23 @@ class AudioReactiveLightingGUI:
         right_col = ttk.Frame(controls_container)
         right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(3, 0))
         
-        # Chaos Level slider (left column)
-        self._create_slider_control(
-            left_col, "Chaos",
-            self._on_chaos_change,
-            0.0, "None", "Wild"
-        )
-        
-        # Echo Length slider (left column)
-        self._create_slider_control(
-            left_col, "Echo",
-            self._on_echo_length_change,
-            0.0, "Off", "Long"
-        )
+        # Chaos level and echo length sliders (left column)
+        self._create_sliders(EFFECTS_SLIDERS, left_col, right_col)
         
         # Color Theme dropdown (left column)
         theme_frame = ttk.Frame(left_col)
         theme_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(theme_frame, text="Theme:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(theme_frame, text="Theme:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         self.theme_var = tk.StringVar(value="Default")
         self.theme_combo = ttk.Combobox(
             theme_frame,
             textvariable=self.theme_var,
-            values=["Default", "Sunset", "Ocean", "Fire", "Forest", "Galaxy", "Mono", "Warm", "Cool"],
+            values=list(THEMES),
             state="readonly",
             width=12,
-            font=('Arial', 9)
+            font=self.font_normal
         )
         self.theme_combo.pack(fill=tk.X, pady=(2, 0))
         self.theme_combo.bind("<<ComboboxSelected>>", self._on_theme_change)
@@ -311,16 +326,16 @@ class AudioReactiveLightingGUI:
         effect_frame = ttk.Frame(right_col)
         effect_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(effect_frame, text="Effect:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(effect_frame, text="Effect:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         self.effect_var = tk.StringVar(value="None")
         self.effect_combo = ttk.Combobox(
             effect_frame,
             textvariable=self.effect_var,
-            values=["None", "Breathe", "Sparkle", "Chase", "Pulse", "Sweep", "Firefly"],
+            values=list(EFFECTS),
             state="readonly",
             width=12,
-            font=('Arial', 9)
+            font=self.font_normal
         )
         self.effect_combo.pack(fill=tk.X, pady=(2, 0))
         self.effect_combo.bind("<<ComboboxSelected>>", self._on_effect_change)
@@ -396,8 +411,7 @@ class AudioReactiveLightingGUI:
         bass_frame = ttk.Frame(freq_frame)
         bass_frame.pack(fill=tk.X, pady=(0, 4))
         ttk.Label(bass_frame, text="Bass:", width=8).pack(side=tk.LEFT)
-        self.bass_bar = ttk.Progressbar(bass_frame, length=150, mode='determinate')
-        self.bass_bar.pack(side=tk.LEFT, padx=(5, 0))
+        self.bass_bar, self.bass_rect = self._create_level_bar(bass_frame)
         self.bass_label = ttk.Label(bass_frame, text="0%", width=5)
         self.bass_label.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -405,8 +419,7 @@ class AudioReactiveLightingGUI:
         mid_frame = ttk.Frame(freq_frame)
         mid_frame.pack(fill=tk.X, pady=(0, 4))
         ttk.Label(mid_frame, text="Mid:", width=8).pack(side=tk.LEFT)
-        self.mid_bar = ttk.Progressbar(mid_frame, length=150, mode='determinate')
-        self.mid_bar.pack(side=tk.LEFT, padx=(5, 0))
+        self.mid_bar, self.mid_rect = self._create_level_bar(mid_frame)
         self.mid_label = ttk.Label(mid_frame, text="0%", width=5)
         self.mid_label.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -414,8 +427,7 @@ class AudioReactiveLightingGUI:
         high_frame = ttk.Frame(freq_frame)
         high_frame.pack(fill=tk.X)
         ttk.Label(high_frame, text="High:", width=8).pack(side=tk.LEFT)
-        self.high_bar = ttk.Progressbar(high_frame, length=150, mode='determinate')
-        self.high_bar.pack(side=tk.LEFT, padx=(5, 0))
+        self.high_bar, self.high_rect = self._create_level_bar(high_frame)
         self.high_label = ttk.Label(high_frame, text="0%", width=5)
         self.high_label.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -423,14 +435,14 @@ class AudioReactiveLightingGUI:
         genre_frame = ttk.LabelFrame(status_container, text="Genre Detection", padding="5")
         genre_frame.pack(fill=tk.X, pady=(0, 8))
         
-        self.genre_label = ttk.Label(genre_frame, text="Detecting...", font=('Arial', 10))
+        self.genre_label = ttk.Label(genre_frame, text="Detecting...", font=self.font_large)
         self.genre_label.pack()
         
         # Build/Drop detection
         event_frame = ttk.LabelFrame(status_container, text="Event Detection", padding="5")
         event_frame.pack(fill=tk.X, pady=(0, 8))
         
-        self.event_label = ttk.Label(event_frame, text="Normal", font=('Arial', 10))
+        self.event_label = ttk.Label(event_frame, text="Normal", font=self.font_large)
         self.event_label.pack()
         
         # DMX info
@@ -440,49 +452,61 @@ class AudioReactiveLightingGUI:
         self.dmx_info_label = ttk.Label(
             dmx_frame,
             text=f"Universe: {config.DMX_UNIVERSE}\nChannels: {config.DMX_CHANNELS}\nFPS: {config.UPDATE_FPS}",
-            font=('Arial', 9)
+            font=self.font_normal
         )
         self.dmx_info_label.pack()
     
-    def _create_slider_control(self, parent, label, command, initial_value, left_label, right_label):
-        """Create a compact slider control with labels."""
+    def _create_level_bar(self, parent):
+        """
+        Create a frequency level bar.
+        
+        A plain Canvas rectangle is much cheaper to update than a themed
+        ttk.Progressbar, which restyles and redraws on every value change.
+        
+        Args:
+            parent: Frame to pack the bar into
+            
+        Returns:
+            (canvas, rectangle item id) tuple
+        """
+        bar = tk.Canvas(
+            parent,
+            width=LEVEL_BAR_WIDTH,
+            height=LEVEL_BAR_HEIGHT,
+            background='#bab5ab',
+            highlightthickness=0,
+            borderwidth=0
+        )
+        bar.pack(side=tk.LEFT, padx=(5, 0))
+        rect = bar.create_rectangle(0, 0, 0, LEVEL_BAR_HEIGHT, fill='#4a6984', width=0)
+        return bar, rect
+    
+    def _create_sliders(self, sliders, left_col, right_col):
+        """Build a tab's slider rows from a MAIN_SLIDERS-style table."""
+        columns = {'left': left_col, 'right': right_col}
+        for column, label, var_name, handler, initial_value, left_label, right_label in sliders:
+            self._create_slider_control(
+                columns[column], label, var_name, getattr(self, handler),
+                initial_value, left_label, right_label
+            )
+    
+    def _create_slider_control(self, parent, label, var_name, command, initial_value, left_label, right_label):
+        """Create a compact slider control with labels, stored as self.<var_name>."""
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=(0, 8))
         
         # Title
-        ttk.Label(frame, text=f"{label}:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
+        ttk.Label(frame, text=f"{label}:", font=self.font_normal_bold).pack(anchor=tk.W)
         
         # Slider frame
         slider_frame = ttk.Frame(frame)
         slider_frame.pack(fill=tk.X, pady=(2, 0))
         
-        # Create variable based on label
-        if label == "Speed":
-            self.smoothness_var = tk.DoubleVar(value=initial_value)
-            var = self.smoothness_var
-        elif label == "Rainbow":
-            self.rainbow_var = tk.DoubleVar(value=initial_value)
-            var = self.rainbow_var
-        elif label == "Brightness":
-            self.brightness_var = tk.DoubleVar(value=initial_value)
-            var = self.brightness_var
-        elif label == "Strobe":
-            self.strobe_var = tk.DoubleVar(value=initial_value)
-            var = self.strobe_var
-        elif label == "Beat Sens":
-            self.beat_sensitivity_var = tk.DoubleVar(value=initial_value)
-            var = self.beat_sensitivity_var
-        elif label == "Chaos":
-            self.chaos_var = tk.DoubleVar(value=initial_value)
-            var = self.chaos_var
-        elif label == "Echo":
-            self.echo_var = tk.DoubleVar(value=initial_value)
-            var = self.echo_var
-        else:
-            var = tk.DoubleVar(value=initial_value)
+        var = tk.DoubleVar(value=initial_value)
+        setattr(self, var_name, var)
         
         # Left label
-        ttk.Label(slider_frame, text=left_label, font=('Arial', 8), foreground='gray').pack(side=tk.LEFT)
+        ttk.Label(slider_frame, text=left_label, font=self.font_small, foreground='gray').pack(side=tk.LEFT)
         
         # Slider
         slider = ttk.Scale(
@@ -491,130 +515,251 @@ class AudioReactiveLightingGUI:
             to=1.0,
             orient=tk.HORIZONTAL,
             variable=var,
-            command=command,
             length=120
         )
+        # React to variable writes rather than per-motion Scale commands
+        trace_id = var.trace_add('write', partial(self._on_slider_write, command))
+        self._slider_traces.append((var, trace_id))
         slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 5))
         
         # Right label
-        ttk.Label(slider_frame, text=right_label, font=('Arial', 8), foreground='gray').pack(side=tk.LEFT)
+        ttk.Label(slider_frame, text=right_label, font=self.font_small, foreground='gray').pack(side=tk.LEFT)
+    
+    def _on_slider_write(self, command, *trace_args):
+        """Variable trace: run the slider's change handler (it reads its own variable)."""
+        if not self._suppress_slider_traces:
+            command()
     
     def _initialize_controller(self):
         """Initialize the DMX controller with the UI's default values."""
         if self.dmx_controller:
             # Set initial values from sliders
-            self._on_smoothness_change(self.smoothness_var.get())
-            self._on_rainbow_change(self.rainbow_var.get())
-            self._on_brightness_change(self.brightness_var.get())
-            self._on_strobe_change(self.strobe_var.get())
+            self._on_smoothness_change()
+            self._on_rainbow_change()
+            self._on_brightness_change()
+            self._on_strobe_change()
+            self._flush_sliders()
             self._on_bpm_sync_change()  # Initialize BPM sync
             self._on_pattern_change()
             # Don't set light count on startup - controller already has default
     
-    def _schedule_update(self):
-        """Schedule periodic GUI updates."""
-        self._update_display()
-        if not self.stop_event.is_set():
-            self.root.after(config.GUI_UPDATE_INTERVAL, self._schedule_update)
+    def _start_updates(self):
+        """
+        Redraw when the audio analyzer reports a state change.
+        
+        The analyzer callback runs on the audio thread and must not call into
+        Tk (tkinter would block it until the Tk thread serviced the call), so
+        it only sets a flag. An after() chain on the Tk thread checks the flag
+        every GUI_UPDATE_INTERVAL, which also caps the redraw rate. Nothing is
+        drawn while the top-level window is iconified or withdrawn.
+        """
+        self._updates_active = True
+        self._state_changed = True
+        
+        # Visibility follows <Map>/<Unmap> on the top-level window, so ticks
+        # don't need a winfo_viewable() round trip to Tcl. The handlers live on
+        # a bindtag of our own, added to the toplevel only, so removing them
+        # leaves other bindings alone and child widget events never reach them.
+        self._visible = True
+        self._toplevel = self.root.winfo_toplevel()
+        self._visibility_tag = f'LightshowVisibility{id(self)}'
+        self._visibility_funcids = (
+            self._toplevel.bind_class(self._visibility_tag, '<Map>', partial(self._on_map_change, True)),
+            self._toplevel.bind_class(self._visibility_tag, '<Unmap>', partial(self._on_map_change, False)),
+        )
+        self._toplevel.bindtags(self._toplevel.bindtags() + (self._visibility_tag,))
+        self.audio_analyzer.add_state_listener(self._notify_audio_state)
+        self.root.after(config.GUI_UPDATE_INTERVAL, self._poll_updates)
+    
+    def _stop_updates(self):
+        """Stop receiving analyzer notifications (safe to call more than once)."""
+        if not self._updates_active:
+            return
+        self._updates_active = False
+        self.audio_analyzer.remove_state_listener(self._notify_audio_state)
+        
+        # Drop our bindtag and its handlers, including their Tcl commands
+        tag = self._visibility_tag
+        self._toplevel.bindtags(tuple(t for t in self._toplevel.bindtags() if t != tag))
+        self._toplevel.unbind_class(tag, '<Map>')
+        self._toplevel.unbind_class(tag, '<Unmap>')
+        # bind_class registers the handlers on the Tk root, so delete them there
+        for funcid in self._visibility_funcids:
+            self._toplevel._root().deletecommand(funcid)
+        
+        # Slider traces hold bound methods, which would keep this GUI alive
+        for var, trace_id in self._slider_traces:
+            var.trace_remove('write', trace_id)
+        self._slider_traces = []
+    
+    def _on_map_change(self, visible, event):
+        """Track whether the top-level window is shown; redraw when it reappears."""
+        self._visible = visible
+        if visible and self._updates_active:
+            self._update_display()
+    
+    def destroy(self):
+        """Stop updates before the parent frame's widgets are destroyed."""
+        self._stop_updates()
+    
+    def _notify_audio_state(self):
+        """Analyzer listener (audio thread): flag a change for the next poll."""
+        self._state_changed = True
+    
+    def _poll_updates(self):
+        """Redraw if the analyzer reported a change since the last poll."""
+        if not self._updates_active:
+            return
+        if self._state_changed:
+            # Clear before drawing so a change arriving meanwhile isn't lost
+            self._state_changed = False
+            self._update_display()
+        self.root.after(config.GUI_UPDATE_INTERVAL, self._poll_updates)
     
     def _update_display(self):
         """Update GUI elements with current audio state."""
-        # Get current state from audio analyzer
-        state = self.audio_analyzer.get_state()
-        bpm = state['bpm']
-        intensity = state['intensity']
-        audio_active = state['audio_active']
+        if not self._visible:
+            return
+        
+        # Lock-free versioned snapshot - nothing to do if the analyzer
+        # hasn't published a change since the last tick
+        version, values = self.audio_analyzer.get_snapshot()
+        last = self._last
+        if version == last['version']:
+            return
+        last['version'] = version
+        bpm, intensity, audio_active, bass, mid, high, is_building, is_drop, genre = values
+        bpm = int(bpm)
+        intensity_percent = int(intensity * 100)
+        
+        # Only touch widgets whose displayed value changed, and send those
+        # updates to Tcl in one batched call instead of one call per widget
+        updates = []
         
         # Update BPM display (no decimal for compact view)
-        self.bpm_label.config(text=f"{int(bpm)}")
+        if bpm != last['bpm']:
+            updates.append((str(self.bpm_label), 'configure', '-text', BPM_TEXT[min(bpm, config.MAX_BPM)]))
+            last['bpm'] = bpm
         
         # Update intensity display
-        intensity_percent = int(intensity * 100)
-        self.intensity_label.config(text=f"{intensity_percent}%")
+        if intensity_percent != last['intensity']:
+            updates.append((str(self.intensity_label), 'configure', '-text', PERCENT_TEXT[min(intensity_percent, 100)]))
+            last['intensity'] = intensity_percent
         
         # Update audio status indicator
-        if audio_active:
-            self.status_indicator.itemconfig(self.status_circle, fill='green')
-            self.status_text.config(text="Playing")
-        else:
-            self.status_indicator.itemconfig(self.status_circle, fill='gray')
-            self.status_text.config(text="No Audio")
+        if audio_active != last['active']:
+            indicator = (str(self.status_indicator), 'itemconfigure', self.status_circle)
+            if audio_active:
+                updates.append(indicator + INDICATOR_ACTIVE)
+                updates.append((str(self.status_text), 'configure', '-text', "Playing"))
+            else:
+                updates.append(indicator + INDICATOR_IDLE)
+                updates.append((str(self.status_text), 'configure', '-text', "No Audio"))
+            last['active'] = audio_active
         
         # Update advanced tab if it exists
         if hasattr(self, 'bass_bar'):
             # Update frequency bars
-            bass_pct = int(state.get('bass', 0) * 100)
-            mid_pct = int(state.get('mid', 0) * 100)
-            high_pct = int(state.get('high', 0) * 100)
+            bass_pct = int(bass * 100)
+            mid_pct = int(mid * 100)
+            high_pct = int(high * 100)
             
-            self.bass_bar['value'] = bass_pct
-            self.bass_label.config(text=f"{bass_pct}%")
-            self.mid_bar['value'] = mid_pct
-            self.mid_label.config(text=f"{mid_pct}%")
-            self.high_bar['value'] = high_pct
-            self.high_label.config(text=f"{high_pct}%")
+            if bass_pct != last['bass']:
+                updates.append((str(self.bass_bar), 'coords', self.bass_rect,
+                                0, 0, LEVEL_BAR_WIDTHS[min(bass_pct, 100)], LEVEL_BAR_HEIGHT))
+                updates.append((str(self.bass_label), 'configure', '-text', PERCENT_TEXT[min(bass_pct, 100)]))
+                last['bass'] = bass_pct
+            if mid_pct != last['mid']:
+                updates.append((str(self.mid_bar), 'coords', self.mid_rect,
+                                0, 0, LEVEL_BAR_WIDTHS[min(mid_pct, 100)], LEVEL_BAR_HEIGHT))
+                updates.append((str(self.mid_label), 'configure', '-text', PERCENT_TEXT[min(mid_pct, 100)]))
+                last['mid'] = mid_pct
+            if high_pct != last['high']:
+                updates.append((str(self.high_bar), 'coords', self.high_rect,
+                                0, 0, LEVEL_BAR_WIDTHS[min(high_pct, 100)], LEVEL_BAR_HEIGHT))
+                updates.append((str(self.high_label), 'configure', '-text', PERCENT_TEXT[min(high_pct, 100)]))
+                last['high'] = high_pct
             
             # Update genre label
-            genre = state.get('genre', 'auto')
-            self.genre_label.config(text=genre.capitalize())
+            if genre != last['genre']:
+                updates.append((str(self.genre_label), 'configure', '-text', genre.capitalize()))
+                last['genre'] = genre
             
             # Update event label
-            if state.get('is_drop', False):
-                self.event_label.config(text="DROP!", foreground='red')
-            elif state.get('is_building', False):
-                self.event_label.config(text="Building...", foreground='orange')
+            if is_drop:
+                event = 'drop'
+            elif is_building:
+                event = 'building'
             else:
-                self.event_label.config(text="Normal", foreground='black')
+                event = 'normal'
+            if event != last['event']:
+                event_label = str(self.event_label)
+                if event == 'drop':
+                    updates.append((event_label, 'configure', '-text', "DROP!", '-foreground', 'red'))
+                elif event == 'building':
+                    updates.append((event_label, 'configure', '-text', "Building...", '-foreground', 'orange'))
+                else:
+                    updates.append((event_label, 'configure', '-text', "Normal", '-foreground', 'black'))
+                last['event'] = event
+        
+        if updates:
+            self.root.tk.call(BATCH_PROC, *updates)
     
-    def _on_smoothness_change(self, value):
+    def _on_smoothness_change(self, _=None):
         """Handle speed slider change (inverted for smoothness)."""
         # Invert the speed value to get smoothness (0=fast/no smooth, 1=slow/smooth)
-        speed = float(value)
+        speed = self.smoothness_var.get()
         smoothness = 1.0 - speed  # Invert: high speed = low smoothness
-        if self.dmx_controller:
-            self.dmx_controller.set_smoothness(smoothness)
+        self._queue_slider('set_smoothness', smoothness)
     
-    def _on_rainbow_change(self, value):
+    def _on_rainbow_change(self, _=None):
         """Handle rainbow slider change."""
-        rainbow_level = float(value)
-        if self.dmx_controller:
-            self.dmx_controller.set_rainbow_level(rainbow_level)
+        rainbow_level = self.rainbow_var.get()
+        self._queue_slider('set_rainbow_level', rainbow_level)
     
-    def _on_brightness_change(self, value):
+    def _on_brightness_change(self, _=None):
         """Handle brightness slider change."""
-        brightness = float(value)
-        if self.dmx_controller:
-            self.dmx_controller.set_brightness(brightness)
+        brightness = self.brightness_var.get()
+        self._queue_slider('set_brightness', brightness)
     
-    def _on_strobe_change(self, value):
+    def _on_strobe_change(self, _=None):
         """Handle strobe slider change."""
-        strobe_level = float(value)
+        strobe_level = self.strobe_var.get()
+        self._queue_slider('set_strobe_level', strobe_level)
+    
+    def _queue_slider(self, setter, value):
+        """
+        Record a slider value and push it to the controller on the next flush.
+        
+        ttk.Scale fires its command for every pixel of a drag; only the latest
+        value per slider is sent, at most every SLIDER_FLUSH_MS.
+        
+        Args:
+            setter: Name of the DMX controller setter to call
+            value: New value for that setter
+        """
+        self._pending_slider[setter] = value
+        if not self._slider_flush_scheduled:
+            self._slider_flush_scheduled = True
+            self.root.after(SLIDER_FLUSH_MS, self._flush_sliders)
+    
+    def _flush_sliders(self):
+        """Send the latest pending slider values to the DMX controller."""
+        self._slider_flush_scheduled = False
+        pending = self._pending_slider
+        self._pending_slider = {}
         if self.dmx_controller:
-            self.dmx_controller.set_strobe_level(strobe_level)
+            for setter, value in pending.items():
+                getattr(self.dmx_controller, setter)(value)
     
-    def _on_beat_sensitivity_change(self, value):
+    def _on_beat_sensitivity_change(self, _=None):
         """Handle beat sensitivity slider change."""
-        beat_sensitivity = float(value)
-        if self.dmx_controller:
-            self.dmx_controller.set_beat_sensitivity(beat_sensitivity)
+        beat_sensitivity = self.beat_sensitivity_var.get()
+        self._queue_slider('set_beat_sensitivity', beat_sensitivity)
     
     def _on_bpm_sync_change(self, event=None):
         """Handle BPM sync dropdown change."""
-        selection = self.bpm_sync_var.get()
-        # Map selection to division value
-        division_map = {
-            "Every beat": 1,
-            "Every 2 beats": 2,
-            "Every 4 beats": 4,
-            "Every 8 beats": 8,
-            "Every 16 beats": 16
-        }
-        division = division_map.get(selection, 1)
-        
-        # Convert division to BPM sync multiplier (inverse relationship)
-        # Division of 1 = 1.0 (100%), division of 2 = 0.5 (50%), etc.
-        bpm_sync = 1.0 / division
-        
+        bpm_sync = BPM_SYNC_RATES.get(self.bpm_sync_var.get(), 1.0)
         if self.dmx_controller:
             self.dmx_controller.set_bpm_sync(bpm_sync)
     
@@ -624,30 +769,27 @@ class AudioReactiveLightingGUI:
         if self.dmx_controller:
             self.dmx_controller.set_mood_match(enabled)
     
-    def _on_chaos_change(self, value):
+    def _on_chaos_change(self, _=None):
         """Handle chaos slider change."""
-        chaos = float(value)
-        if self.dmx_controller:
-            self.dmx_controller.set_chaos_level(chaos)
+        chaos = self.chaos_var.get()
+        self._queue_slider('set_chaos_level', chaos)
     
-    def _on_echo_length_change(self, value):
+    def _on_echo_length_change(self, _=None):
         """Handle echo length slider change."""
-        length = float(value) * 2.0  # Scale 0-1 to 0-2 seconds
+        length = self.echo_var.get() * 2.0  # Scale 0-1 to 0-2 seconds
         if self.dmx_controller:
             self.dmx_controller.set_echo_length(length)
             self.dmx_controller.set_echo_enabled(length > 0)
     
     def _on_theme_change(self, event=None):
         """Handle color theme selection."""
-        theme = self.theme_var.get().lower()
-        if theme == 'mono':
-            theme = 'monochrome'
+        theme = THEMES[self.theme_var.get()]
         if self.dmx_controller:
             self.dmx_controller.set_color_theme(theme)
     
     def _on_effect_change(self, event=None):
         """Handle effect mode selection."""
-        effect = self.effect_var.get().lower()
+        effect = EFFECTS[self.effect_var.get()]
         if self.dmx_controller:
             self.dmx_controller.set_effect_mode(effect)
     
@@ -677,7 +819,7 @@ class AudioReactiveLightingGUI:
     
     def _on_pattern_change(self, event=None):
         """Handle pattern selection change."""
-        pattern = self.pattern_var.get().lower()
+        pattern = PATTERNS[self.pattern_var.get()]
         if self.dmx_controller:
             self.dmx_controller.set_pattern(pattern)
     
@@ -706,11 +848,16 @@ class AudioReactiveLightingGUI:
     
     def _on_reset(self):
         """Reset all controls to default values."""
+        # Drop queued slider moves so they don't override the reset
+        self._pending_slider.clear()
+        
         # First, call the controller's reset method for a thorough reset
         if self.dmx_controller:
             self.dmx_controller.reset()
         
-        # Reset all UI elements to match defaults
+        # Reset all UI elements to match defaults (the controller was reset
+        # above, so don't echo the slider writes back to it)
+        self._suppress_slider_traces = True
         self.smoothness_var.set(0.5)  # 0.5 = 50% smoothness (inverted)
         self.rainbow_var.set(0.5)  # 50% rainbow
         self.brightness_var.set(0.5)  # 50% brightness
@@ -723,6 +870,7 @@ class AudioReactiveLightingGUI:
             self.chaos_var.set(0.0)  # No chaos
         if hasattr(self, 'echo_var'):
             self.echo_var.set(0.0)  # No echo
+        self._suppress_slider_traces = False
         
         # Reset dropdowns
         self.theme_var.set("Default")
@@ -742,16 +890,9 @@ class AudioReactiveLightingGUI:
         self.light_count_label.config(text=str(config.DEFAULT_LIGHT_COUNT))
         self.info_label.config(text=f"{config.DEFAULT_LIGHT_COUNT} PAR • DMX 1")
     
-    def _on_quit(self):
-        """Handle quit button click."""
-        self.stop_event.set()
-        self.root.after(500, self.root.destroy)
-    
-    def _on_closing(self):
-        """Handle window close event."""
+    def _on_closing(self, event=None):
+        """Handle quit button, quit keys, window close and shutdown requests."""
         self.stop_event.set()
-        self.root.destroy()
-    
-    def run(self):
-        """Start the GUI main loop."""
-        self.root.mainloop()
\ No newline at end of file
+        self._stop_updates()
+        # When embedded, self.root is only our frame - close the whole window
+        self.root.winfo_toplevel().destroy()
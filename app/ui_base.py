@@ -0,0 +1,67 @@
+"""
+Base window class and display constants shared by the UI modules.
+"""
+
+import sys
+import tkinter as tk
+from tkinter import ttk
+import config
+
+
+# Preformatted label text shared by the UIs (the analyzer clamps BPM to MAX_BPM)
+BPM_TEXT = tuple(str(i) for i in range(config.MAX_BPM + 1))
+PERCENT_TEXT = tuple(f"{i}%" for i in range(101))
+
+# Prebuilt itemconfigure options for the audio status indicator
+INDICATOR_ACTIVE = ('-fill', 'green')
+INDICATOR_IDLE = ('-fill', 'gray')
+
+
+class BaseWindowUI:
+    """Base class for UIs that own a top-level Tk window."""
+    
+    def _create_window(self, title):
+        """Create the top-level window hidden; subclasses define _on_closing."""
+        self.root = tk.Tk()
+        self.root.title(title)
+        
+        # Keep the window hidden while widgets are built so it is drawn once
+        self.root.withdraw()
+        
+        # Set window size
+        if config.FULLSCREEN:
+            self.root.attributes('-fullscreen', True)
+            # Bind multiple keys to exit for safety
+            self.root.bind('<Escape>', self._on_closing)
+            self.root.bind('<q>', self._on_closing)
+            self.root.bind('<Q>', self._on_closing)
+        else:
+            self.root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
+        
+        # Configure window close handler
+        self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        
+        # Shutdown requested from outside the Tk thread (see request_shutdown)
+        self.root.bind('<<Shutdown>>', self._on_closing)
+        
+        # Style configuration
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+    
+    def _show_window(self):
+        """Settle geometry, then show the finished window."""
+        self.root.update_idletasks()
+        self.root.deiconify()
+    
+    def request_shutdown(self):
+        """Ask the Tk main loop to close the window; it ends the GUI's after() chains."""
+        try:
+            self.root.event_generate('<<Shutdown>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            pass  # Window already destroyed
+    
+    def run(self):
+        """Start the GUI main loop with fewer GIL handoffs to the audio and DMX threads."""
+        if config.GIL_SWITCH_INTERVAL:
+            sys.setswitchinterval(config.GIL_SWITCH_INTERVAL)
+        self.root.mainloop()
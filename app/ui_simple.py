@@ -4,7 +4,14 @@ Simple mode UI with minimal controls for preset programs.
 
 import tkinter as tk
 from tkinter import ttk
+import queue
 import config
+from lighting_simple import SimpleDmxController
+from ui_base import BPM_TEXT, PERCENT_TEXT, INDICATOR_ACTIVE, INDICATOR_IDLE
+
+
+# Preformatted label text for the dimming display
+DIMMING_TEXT = tuple(f"({i}%)" for i in range(101))
 
 
 class SimpleUI:
@@ -25,9 +32,25 @@ class SimpleUI:
         self.dmx_controller = dmx_controller
         self.stop_event = stop_event
         
+        # Last values shown by _update_display (None forces the first draw)
+        self._last_bpm = self._last_pct = self._last_active = None
+        
+        # Latest analyzer snapshot, pushed from the audio thread only when the
+        # state changes; holds at most one entry (newest wins)
+        self._state_q = queue.Queue(maxsize=1)
+        self._active = True
+        
+        # Dimming slider moved since the last idle flush
+        self._dimming_flush_scheduled = False
+        
         # Create UI elements
         self._create_widgets()
         
+        # Seed with the current state, then follow analyzer changes
+        if self.audio_analyzer:
+            self._on_audio_state()
+            self.audio_analyzer.add_state_listener(self._on_audio_state)
+        
         # Start periodic updates
         self._schedule_update()
         
@@ -48,6 +71,13 @@ class SimpleUI:
             1, 1, 9, 9, fill='gray', outline='black'
         )
         
+        # Complete Tcl commands for the indicator, issued with a direct
+        # tk.call instead of going through Canvas.itemconfigure
+        indicator = (str(self.status_indicator), 'itemconfigure', self.status_circle)
+        self._indicator_active = indicator + INDICATOR_ACTIVE
+        self._indicator_idle = indicator + INDICATOR_IDLE
+        self._tkcall = self.status_indicator.tk.call
+        
         # Audio status
         self.audio_status = ttk.Label(
             status_frame,
@@ -91,31 +121,7 @@ class SimpleUI:
         self.program_combo = ttk.Combobox(
             program_frame,
             textvariable=self.program_var,
-            values=[
-                "Bounce (Same Color)",
-                "Bounce (Different Colors)",
-                "Bounce (Discrete)",
-                "Swell (Different Colors)",
-                "Swell (Same Color)",
-                "Disco",
-                "Psych",
-                "Pulse",
-                "Spectrum",
-                "Strobe",
-                "Chase",
-                "Center Burst",
-                "VU Meter",
-                "Ripple",
-                "Alternating",
-                "Kaleidoscope",
-                "Spiral",
-                "Breathing",
-                "Interference",
-                "Color Ripples",
-                "Ripple Bounce",
-                "Ripple Bounce Color",
-                "DJ Mode"
-            ],
+            values=SimpleDmxController.PROGRAMS,
             state="readonly",
             font=('Arial', 9),
             width=18
@@ -134,7 +140,7 @@ class SimpleUI:
         self.bpm_sync_combo = ttk.Combobox(
             bpm_frame,
             textvariable=self.bpm_sync_var,
-            values=["Every beat", "Every 2 beats", "Every 4 beats", "Every 8 beats", "Every 16 beats"],
+            values=list(config.BPM_SYNC_DIVISIONS),
             state="readonly",
             width=13,
             font=('Arial', 9)
@@ -236,22 +242,24 @@ class SimpleUI:
         """Handle BPM sync dropdown change."""
         selection = self.bpm_sync_var.get()
         # Map selection to division value
-        division_map = {
-            "Every beat": 1,
-            "Every 2 beats": 2,
-            "Every 4 beats": 4,
-            "Every 8 beats": 8,
-            "Every 16 beats": 16
-        }
-        division = division_map.get(selection, 1)
+        division = config.BPM_SYNC_DIVISIONS.get(selection, 1)
         
         if self.dmx_controller:
             self.dmx_controller.set_bpm_division(division)
         
-    def _on_dimming_change(self, value):
-        """Handle dimming slider change."""
-        percent = float(value)
-        self.dimming_label.config(text=f"({int(percent)}%)")
+    def _on_dimming_change(self, _=None):
+        """Handle dimming slider change (applied once per idle cycle)."""
+        if not self._dimming_flush_scheduled:
+            self._dimming_flush_scheduled = True
+            self.parent.after_idle(self._flush_dimming)
+        
+    def _flush_dimming(self):
+        """Apply the latest dimming value from a slider drag."""
+        self._dimming_flush_scheduled = False
+        if not self._active:
+            return
+        percent = self.dimming_var.get()
+        self.dimming_label.config(text=DIMMING_TEXT[int(percent)])
         
         if self.dmx_controller:
             # Convert percentage to 0.0-1.0
@@ -263,35 +271,61 @@ class SimpleUI:
         if self.dmx_controller:
             self.dmx_controller.set_cool_colors(enabled)
             
+    def _on_audio_state(self):
+        """Analyzer listener (audio thread): replace the queued snapshot with the newest."""
+        _, snapshot = self.audio_analyzer.get_snapshot()
+        try:
+            self._state_q.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self._state_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._state_q.put_nowait(snapshot)
+            except queue.Full:
+                pass  # The GUI will pick up the next change
+            
     def _schedule_update(self):
         """Schedule periodic display updates."""
+        if not self._active:
+            return
         self._update_display()
-        if not self.stop_event.is_set():
-            self.parent.after(250, self._schedule_update)  # Update every 250ms
+        self.parent.after(250, self._schedule_update)  # Check every 250ms
             
     def _update_display(self):
-        """Update status display with current audio state."""
-        if self.audio_analyzer:
-            state = self.audio_analyzer.get_state()
-            
-            # Audio status indicator and text
-            if state['audio_active']:
-                self.status_indicator.itemconfig(self.status_circle, fill='green')
+        """Update status display from the latest pushed audio state, if any."""
+        try:
+            snapshot = self._state_q.get_nowait()
+        except queue.Empty:
+            return  # Nothing changed since the last update
+        bpm, intensity, audio_active = snapshot[:3]
+        
+        # Widgets are only touched when their displayed value changes
+        # Audio status indicator and text
+        if audio_active != self._last_active:
+            if audio_active:
+                self._tkcall(*self._indicator_active)
                 self.audio_status.config(text="Playing")
             else:
-                self.status_indicator.itemconfig(self.status_circle, fill='gray')
+                self._tkcall(*self._indicator_idle)
                 self.audio_status.config(text="No Audio")
-                
-            # BPM
-            bpm = state['bpm']
-            if bpm > 0:
-                self.bpm_label.config(text=f"{int(bpm)}")
+            self._last_active = audio_active
+            
+        # BPM (-1 stands for "no BPM yet")
+        bpm_i = int(bpm) if bpm > 0 else -1
+        if bpm_i != self._last_bpm:
+            if bpm_i >= 0:
+                self.bpm_label.config(text=BPM_TEXT[min(bpm_i, config.MAX_BPM)])
             else:
                 self.bpm_label.config(text="--")
-                
-            # Level/Intensity
-            intensity_percent = int(state['intensity'] * 100)
-            self.intensity_label.config(text=f"{intensity_percent}%")
+            self._last_bpm = bpm_i
+            
+        # Level/Intensity
+        intensity_percent = int(intensity * 100)
+        if intensity_percent != self._last_pct:
+            self.intensity_label.config(text=PERCENT_TEXT[min(intensity_percent, 100)])
+            self._last_pct = intensity_percent
     
     def _increment_lights(self):
         """Increment the number of active lights."""
@@ -317,5 +351,7 @@ class SimpleUI:
                 
     def destroy(self):
         """Clean up the UI."""
-        # Nothing special needed for simple UI
-        pass
\ No newline at end of file
+        # Stop the update loop and analyzer notifications
+        self._active = False
+        if self.audio_analyzer:
+            self.audio_analyzer.remove_state_listener(self._on_audio_state)
\ No newline at end of file